@@ -106,7 +106,7 @@ class ConversationContext:
         }
 
 
-@dataclass
+@dataclass(frozen=True)
 class Intent:
     intent_type: IntentType
     confidence: float
@@ -12,7 +12,7 @@ from .base_agent import BaseAgent, AgentType, AgentResult, ConversationContext
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils.data_access import DataAccess
+from utils.data_access import get_data_access
 
 
 @dataclass
@@ -52,7 +52,7 @@ class KnowledgeAgent(BaseAgent):
     
     def __init__(self, sqlite_db_path: str = "./data/voice_assistant.db", chroma_db_path: str = "./data/chroma_db"):
         super().__init__("KnowledgeAgent", AgentType.KNOWLEDGE)
-        self.data_access = DataAccess(sqlite_db_path, chroma_db_path)
+        self.data_access = get_data_access(sqlite_db_path, chroma_db_path)
         self.relevance_threshold = 0.5  # Lower threshold for better recall
         self.max_chunks_per_response = 5
     
@@ -60,7 +60,7 @@ class KnowledgeAgent(BaseAgent):
         """
         Process a knowledge-related query using RAG operations.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Perform semantic search
@@ -95,7 +95,7 @@ class KnowledgeAgent(BaseAgent):
                 "knowledge_chunks": [self._chunk_to_dict(chunk) for chunk in relevant_chunks[:self.max_chunks_per_response]]
             }
             
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             # Be less aggressive about escalation for follow-up questions
             is_followup = any(word in query.lower() for word in ['it', 'that', 'this', 'smaller', 'shorter', 'more', 'less'])
             requires_escalation = (confidence < 0.4 or len(relevant_chunks) == 0) and not is_followup
@@ -114,7 +114,7 @@ class KnowledgeAgent(BaseAgent):
             )
             
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             return AgentResult(
                 agent_name=self.name,
                 data={"error": str(e)},
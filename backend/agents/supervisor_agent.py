@@ -5,6 +5,7 @@ SupervisorAgent implementation with AWS Bedrock integration for intent analysis
 import asyncio
 import json
 import time
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
 
 import boto3
@@ -17,6 +18,9 @@ from .base_agent import (
 from llm_client import get_llm_client
 from services.fast_intent_classifier import classify_intent_fast
 
+# LLM intent results remembered per (query, conversation context)
+_INTENT_CACHE_SIZE = 256
+
 
 class SupervisorAgent(BaseAgent):
     """
@@ -30,6 +34,7 @@ class SupervisorAgent(BaseAgent):
         self.llm_client = get_llm_client(aws_region)
         self.model_id = "anthropic.claude-3-5-sonnet-20241022-v2:0"  # Using Claude 3.5 Sonnet
         self.escalation_threshold = 0.6
+        self._intent_cache: "OrderedDict[Tuple[str, str], Intent]" = OrderedDict()
     
 
     
@@ -37,7 +42,7 @@ class SupervisorAgent(BaseAgent):
         """
         Process a query by analyzing intent and coordinating with other agents.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Analyze intent
@@ -54,7 +59,7 @@ class SupervisorAgent(BaseAgent):
                 "query": query
             }
             
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             # Determine if escalation is required
             requires_escalation = (
@@ -72,7 +77,7 @@ class SupervisorAgent(BaseAgent):
             )
             
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             return AgentResult(
                 agent_name=self.name,
                 data={"error": str(e)},
@@ -113,6 +118,19 @@ class SupervisorAgent(BaseAgent):
         # Build context from conversation history
         conversation_context = self._build_conversation_context(context)
         
+        # The LLM's answer depends only on the query and the recent history it sees,
+        # so an identical pair (a repeated question, a retried turn) skips the call
+        cache_key = (query, conversation_context)
+        cached = self._intent_cache.get(cache_key)
+        if cached is not None:
+            self._intent_cache.move_to_end(cache_key)
+            return Intent(
+                intent_type=cached.intent_type,
+                confidence=cached.confidence,
+                entities=dict(cached.entities),
+                reasoning=cached.reasoning
+            )
+        
         # Create prompt for intent analysis
         prompt = self._create_intent_analysis_prompt(query, conversation_context)
         
@@ -131,12 +149,25 @@ class SupervisorAgent(BaseAgent):
         # Parse response
         intent_data = self._parse_intent_response(response)
         
-        return Intent(
+        intent = Intent(
             intent_type=IntentType(intent_data.get("intent_type", "unknown")),
             confidence=intent_data.get("confidence", 0.0),
             entities=intent_data.get("entities", {}),
             reasoning=intent_data.get("reasoning")
         )
+        
+        # Unparseable or unknown answers are worth asking again next time
+        if intent.intent_type is not IntentType.UNKNOWN and isinstance(intent.entities, dict):
+            self._intent_cache[cache_key] = Intent(
+                intent_type=intent.intent_type,
+                confidence=intent.confidence,
+                entities=dict(intent.entities),
+                reasoning=intent.reasoning
+            )
+            if len(self._intent_cache) > _INTENT_CACHE_SIZE:
+                self._intent_cache.popitem(last=False)
+        
+        return intent
     
     def _build_conversation_context(self, context: ConversationContext) -> str:
         """Build conversation context string from history."""
@@ -218,7 +249,7 @@ Respond only with the JSON object, no additional text."""
             }
             
             # Make the call in a thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             response = await loop.run_in_executor(
                 None,
                 lambda: self.llm_client.invoke_model(
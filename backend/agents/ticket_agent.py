@@ -3,6 +3,7 @@ TicketAgent implementation for structured data queries on support tickets.
 """
 
 import asyncio
+import re
 import sqlite3
 import time
 from typing import Dict, List, Optional, Any, Tuple
@@ -12,7 +13,9 @@ from .base_agent import BaseAgent, AgentType, AgentResult, ConversationContext
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils.data_access import DataAccess
+from utils.data_access import get_data_access
+
+_NUM_RE = re.compile(r'\d+')
 
 
 class SearchCriteria:
@@ -63,14 +66,14 @@ class TicketAgent(BaseAgent):
     
     def __init__(self, sqlite_db_path: str = "./data/voice_assistant.db", chroma_db_path: str = "./data/chroma_db"):
         super().__init__("TicketAgent", AgentType.TICKET)
-        self.data_access = DataAccess(sqlite_db_path, chroma_db_path)
+        self.data_access = get_data_access(sqlite_db_path, chroma_db_path)
         self.sqlite_db_path = sqlite_db_path
     
     async def process_query(self, query: str, context: ConversationContext) -> AgentResult:
         """
         Process a ticket-related query and return structured results.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Parse query to extract search criteria
@@ -101,7 +104,7 @@ class TicketAgent(BaseAgent):
                 total = result_data.get('total_found', 0)
                 print(f"🔍 Search found {total} tickets")
             
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             requires_escalation = confidence < 0.6 or not result_data
             
             return AgentResult(
@@ -117,7 +120,7 @@ class TicketAgent(BaseAgent):
             )
             
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             return AgentResult(
                 agent_name=self.name,
                 data={"error": str(e)},
@@ -305,8 +308,6 @@ class TicketAgent(BaseAgent):
     
     def _normalize_ticket_id(self, raw_id: str) -> str:
         """Normalize ticket ID to IT-XXX format."""
-        import re
-        
         # Remove any spaces and convert to uppercase
         raw_id = raw_id.strip().upper()
         
@@ -314,20 +315,10 @@ class TicketAgent(BaseAgent):
         if raw_id.startswith('IT-'):
             return raw_id
         
-        # If it starts with IT but no dash, add the dash
-        if raw_id.startswith('IT') and len(raw_id) > 2:
-            number_part = raw_id[2:]
-            if number_part.isdigit():
-                return f"IT-{number_part.zfill(3)}"
-        
-        # If it's just a number, add IT- prefix and pad with zeros
-        if raw_id.isdigit():
-            return f"IT-{raw_id.zfill(3)}"
-        
-        # If it has other format, try to extract numbers
-        numbers = re.findall(r'\d+', raw_id)
-        if numbers:
-            return f"IT-{numbers[0].zfill(3)}"
+        # "IT005", "5" and anything else with digits all take the first run of digits
+        match = _NUM_RE.search(raw_id)
+        if match:
+            return f"IT-{match.group().zfill(3)}"
         
         # Return as is if no clear pattern
         return raw_id
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Shared boto3 session for AWS clients.
+Credentials, config files and service models are resolved once per region
+instead of once per client.
+"""
+
+import threading
+from typing import Any, Dict
+
+import boto3
+
+_sessions: Dict[str, boto3.session.Session] = {}
+_lock = threading.Lock()  # boto3 sessions are not thread-safe
+
+
+def get_aws_client(service_name: str, region_name: str, **kwargs: Any):
+    """Create an AWS client from the shared session for ``region_name``."""
+    with _lock:
+        session = _sessions.get(region_name)
+        if session is None:
+            session = _sessions[region_name] = boto3.session.Session(region_name=region_name)
+        return session.client(service_name, **kwargs)
@@ -43,13 +43,13 @@ class PresentationDemo:
         print(f"{'='*60}")
         print(f"❓ User Query: \"{query}\"")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Step 1: Supervisor Agent (Intent Detection & Routing)
         print(f"\n📋 STEP 1: Intent Detection & Routing")
-        supervisor_start = time.time()
+        supervisor_start = time.perf_counter()
         supervisor_result = await self.supervisor_agent.process_query(query, self.session)
-        supervisor_time = time.time() - supervisor_start
+        supervisor_time = time.perf_counter() - supervisor_start
         
         intent_data = supervisor_result.data.get('intent')
         routing_decision = supervisor_result.data.get('routing_decision', [])
@@ -66,9 +66,9 @@ class PresentationDemo:
         
         if 'ticket' in routing_decision:
             print(f"   🎫 Calling TicketAgent...")
-            ticket_start = time.time()
+            ticket_start = time.perf_counter()
             ticket_result = await self.ticket_agent.process_query(query, self.session)
-            ticket_time = time.time() - ticket_start
+            ticket_time = time.perf_counter() - ticket_start
             agent_results.append(ticket_result)
             agent_times["TicketAgent"] = ticket_time
             
@@ -78,9 +78,9 @@ class PresentationDemo:
         
         if 'knowledge' in routing_decision:
             print(f"   📚 Calling KnowledgeAgent...")
-            knowledge_start = time.time()
+            knowledge_start = time.perf_counter()
             knowledge_result = await self.knowledge_agent.process_query(query, self.session)
-            knowledge_time = time.time() - knowledge_start
+            knowledge_time = time.perf_counter() - knowledge_start
             agent_results.append(knowledge_result)
             agent_times["KnowledgeAgent"] = knowledge_time
             
@@ -90,7 +90,7 @@ class PresentationDemo:
         
         # Step 3: Response Humanization
         print(f"\n📋 STEP 3: Response Humanization")
-        humanizer_start = time.time()
+        humanizer_start = time.perf_counter()
         
         agent_data = []
         for result in agent_results:
@@ -107,8 +107,8 @@ class PresentationDemo:
             context={'session_id': self.session.session_id}
         )
         
-        humanizer_time = time.time() - humanizer_start
-        total_time = time.time() - start_time
+        humanizer_time = time.perf_counter() - humanizer_start
+        total_time = time.perf_counter() - start_time
         
         print(f"   💬 Response Generated")
         print(f"   📏 Response Length: {len(final_response)} characters")
@@ -51,6 +51,14 @@ class DemoTestRunner:
         )
         await self.performance_optimizer.initialize_async_components()
         
+        # Warm up outside the measured tests: the first SQLite read, ChromaDB index
+        # load and Bedrock embedding call pay one-time costs that would otherwise
+        # land on test 1
+        warmup_start = time.perf_counter()
+        self.ticket_agent.data_access.health_check()
+        await self.knowledge_agent.data_access.search_knowledge_base("warm up", top_k=1)
+        print(f"🔥 Warm-up completed in {time.perf_counter() - warmup_start:.3f}s")
+        
         print("✅ All components initialized successfully!")
         
     async def run_demo_tests(self):
@@ -121,18 +129,18 @@ class DemoTestRunner:
         session.add_message(test_case['question'], "user", confidence=1.0)
         
         # Start timing
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Step 1: Supervisor Agent Processing
             print("\n🧠 Step 1: Intent Analysis & Routing...")
-            supervisor_start = time.time()
+            supervisor_start = time.perf_counter()
             
             supervisor_result = await self.supervisor_agent.process_query(
                 test_case['question'], session
             )
             
-            supervisor_time = time.time() - supervisor_start
+            supervisor_time = time.perf_counter() - supervisor_start
             
             # Extract routing decision
             intent_data = supervisor_result.data.get('intent')
@@ -147,41 +155,46 @@ class DemoTestRunner:
             agent_results = [supervisor_result]
             agent_times = {"SupervisorAgent": supervisor_time}
             
-            # Execute routed agents
-            if 'ticket' in routing_decision:
-                ticket_start = time.time()
-                ticket_result = await self.ticket_agent.process_query(test_case['question'], session)
-                ticket_time = time.time() - ticket_start
-                
-                agent_results.append(ticket_result)
-                agent_times["TicketAgent"] = ticket_time
-                print(f"   📋 TicketAgent: {ticket_time:.3f}s")
-                
-                # Show ticket data if found
-                if ticket_result.data.get('found'):
-                    ticket = ticket_result.data.get('ticket', {})
-                    print(f"      → Found: {ticket.get('id')} - {ticket.get('status')}")
-                else:
-                    print(f"      → No tickets found")
+            # Execute routed agents concurrently, like the orchestrator does; they only
+            # depend on the routing decision, so their I/O can overlap
+            async def timed_query(agent):
+                agent_start = time.perf_counter()
+                result = await agent.process_query(test_case['question'], session)
+                return result, time.perf_counter() - agent_start
             
+            routed_agents = []
+            if 'ticket' in routing_decision:
+                routed_agents.append(self.ticket_agent)
             if 'knowledge' in routing_decision:
-                knowledge_start = time.time()
-                knowledge_result = await self.knowledge_agent.process_query(test_case['question'], session)
-                knowledge_time = time.time() - knowledge_start
-                
-                agent_results.append(knowledge_result)
-                agent_times["KnowledgeAgent"] = knowledge_time
-                print(f"   📚 KnowledgeAgent: {knowledge_time:.3f}s")
+                routed_agents.append(self.knowledge_agent)
+            timed_results = await asyncio.gather(*(timed_query(agent) for agent in routed_agents))
+            
+            for agent, (result, agent_time) in zip(routed_agents, timed_results):
+                agent_results.append(result)
                 
-                # Show knowledge data if found
-                if knowledge_result.data.get('found'):
-                    print(f"      → Found relevant documentation")
+                if agent is self.ticket_agent:
+                    agent_times["TicketAgent"] = agent_time
+                    print(f"   📋 TicketAgent: {agent_time:.3f}s")
+                    
+                    # Show ticket data if found
+                    if result.data.get('found'):
+                        ticket = result.data.get('ticket', {})
+                        print(f"      → Found: {ticket.get('id')} - {ticket.get('status')}")
+                    else:
+                        print(f"      → No tickets found")
                 else:
-                    print(f"      → No relevant docs found")
+                    agent_times["KnowledgeAgent"] = agent_time
+                    print(f"   📚 KnowledgeAgent: {agent_time:.3f}s")
+                    
+                    # Show knowledge data if found
+                    if result.data.get('found'):
+                        print(f"      → Found relevant documentation")
+                    else:
+                        print(f"      → No relevant docs found")
             
             # Step 3: Response Generation
             print("\n💬 Step 3: Response Generation...")
-            response_start = time.time()
+            response_start = time.perf_counter()
             
             # Convert to format expected by humanizer
             agent_data = []
@@ -199,8 +212,8 @@ class DemoTestRunner:
                 context={'session_id': session.session_id}
             )
             
-            response_time = time.time() - response_start
-            total_time = time.time() - start_time
+            response_time = time.perf_counter() - response_start
+            total_time = time.perf_counter() - start_time
             
             print(f"   ⏱️  Time: {response_time:.3f}s")
             
@@ -244,7 +257,7 @@ class DemoTestRunner:
                 'question_type': test_case['type'],
                 'question': test_case['question'],
                 'error': str(e),
-                'total_time': time.time() - start_time,
+                'total_time': time.perf_counter() - start_time,
                 'agents_used': [],
                 'routing_accuracy': 0.0,
                 'overall_confidence': 0.0
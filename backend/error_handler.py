@@ -180,13 +180,19 @@ class ErrorHandler:
         # Generate unique error ID
         error_id = f"ERR_{int(time.time())}_{hash(str(exception)) % 10000:04d}"
         
+        # Stack traces are only ever logged for high/critical errors; don't walk
+        # and format the frames for the routine ones
+        stack_trace = None
+        if context.severity in (ErrorSeverity.HIGH, ErrorSeverity.CRITICAL):
+            stack_trace = traceback.format_exc()
+        
         # Create error record
         error_record = ErrorRecord(
             error_id=error_id,
             context=context,
             exception=exception,
             error_message=str(exception),
-            stack_trace=traceback.format_exc()
+            stack_trace=stack_trace
         )
         
         # Log the error
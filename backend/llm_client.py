@@ -8,14 +8,22 @@ Uses the converse API for better compatibility.
 import json
 import logging
 import os
+import threading
+from array import array
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional
-import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
+from aws_session import get_aws_client
 from ollama_client import get_ollama_client
 
 logger = logging.getLogger(__name__)
 
+# Titan query embeddings remembered per exact text; the same questions come up again and again.
+# Stored as packed doubles (~8 KB per 1024-dim vector) rather than tuples of float objects.
+EMBEDDING_CACHE_SIZE = int(os.getenv('EMBEDDING_CACHE_SIZE', '256'))
+
 
 class LLMClient:
     """
@@ -28,6 +36,8 @@ class LLMClient:
         self.bedrock_client = None
         self.ollama_client = None
         self.use_ollama = False
+        self._embedding_cache: "OrderedDict[str, array]" = OrderedDict()
+        self._embedding_cache_lock = threading.Lock()
         
         # Primary model configuration
         self.primary_model = 'openai.gpt-oss-120b-1:0'  # Using your working model
@@ -42,7 +52,13 @@ class LLMClient:
     def _try_initialize_bedrock(self):
         """Try to initialize AWS Bedrock client with converse API."""
         try:
-            self.bedrock_client = boto3.client('bedrock-runtime', region_name=self.aws_region)
+            # Size the HTTP pool to the humanizer's LLM worker pool so concurrent
+            # calls reuse kept-alive connections instead of opening new ones
+            self.bedrock_client = get_aws_client(
+                'bedrock-runtime',
+                self.aws_region,
+                config=Config(max_pool_connections=int(os.getenv('LLM_POOL_SIZE', '16')))
+            )
             
             # Test with a simple converse call using your working syntax
             test_response = self.bedrock_client.converse(
@@ -334,14 +350,7 @@ Remember: You're here to make IT support feel personal and helpful, not automate
             try:
                 embeddings = []
                 for text in texts:
-                    body = json.dumps({"inputText": text})
-                    response = self.bedrock_client.invoke_model(
-                        modelId="amazon.titan-embed-text-v2:0",
-                        body=body,
-                        contentType="application/json"
-                    )
-                    response_body = json.loads(response['body'].read())
-                    embeddings.append(response_body['embedding'])
+                    embeddings.append(list(self._titan_embedding(text)))
                 return embeddings
                 
             except Exception as e:
@@ -363,6 +372,30 @@ Remember: You're here to make IT support feel personal and helpful, not automate
             # Use 768 dimensions to match Ollama nomic-embed-text model
             return [[0.0] * 768 for _ in texts]
     
+    def _titan_embedding(self, text: str) -> array:
+        """Embed one text with Titan, served from the LRU when it was embedded recently."""
+        with self._embedding_cache_lock:
+            embedding = self._embedding_cache.get(text)
+            if embedding is not None:
+                self._embedding_cache.move_to_end(text)
+                return embedding
+        
+        body = json.dumps({"inputText": text})
+        response = self.bedrock_client.invoke_model(
+            modelId="amazon.titan-embed-text-v2:0",
+            body=body,
+            contentType="application/json"
+        )
+        response_body = json.loads(response['body'].read())
+        embedding = array('d', response_body['embedding'])
+        
+        if EMBEDDING_CACHE_SIZE > 0:
+            with self._embedding_cache_lock:
+                self._embedding_cache[text] = embedding
+                if len(self._embedding_cache) > EMBEDDING_CACHE_SIZE:
+                    self._embedding_cache.popitem(last=False)
+        return embedding
+    
     def health_check(self) -> bool:
         """Perform health check on current provider."""
         try:
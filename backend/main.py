@@ -7,6 +7,7 @@ Real-time voice interaction with multi-agent processing and interruption handlin
 import asyncio
 import logging
 import os
+import re
 import signal
 import sys
 import time
@@ -15,6 +16,11 @@ from datetime import datetime
 from typing import Dict, Optional, Any, List
 from dotenv import load_dotenv
 
+try:
+    import uvloop  # optional: libuv-based event loop, faster per-await and socket I/O
+except ImportError:
+    uvloop = None
+
 # Import components
 from voice_processor import VoiceProcessor, VoiceProcessorConfig
 from voice_input_handler import VoiceInput
@@ -36,6 +42,26 @@ from logging_config import setup_clean_logging
 setup_clean_logging()
 logger = logging.getLogger(__name__)
 
+# Phrases from the assistant's own replies; a transcript containing one is likely
+# audio feedback. Scanned with one alternation instead of one `in` per phrase.
+_FEEDBACK_PHRASES = (
+    "what else would you like",
+    "yes i'm listening",
+    "sure what did you want",
+    "of course go ahead",
+    "what else can i help",
+    "you have another question",
+)
+_FEEDBACK_RE = re.compile("|".join(map(re.escape, _FEEDBACK_PHRASES)))
+
+# Substrings that mark an interruption as a follow-up to the previous question
+_FOLLOW_UP_INDICATORS = (
+    'also', 'and', 'additionally', 'plus', 'furthermore',
+    'what about', 'how about', 'tell me more', 'more details',
+    'can you also', 'what else', 'anything else',
+)
+_FOLLOW_UP_RE = re.compile("|".join(map(re.escape, _FOLLOW_UP_INDICATORS)))
+
 
 class VoiceAssistantOrchestrator:
     """
@@ -56,6 +82,7 @@ class VoiceAssistantOrchestrator:
         
         # State management
         self.is_running = False
+        self._stop_event: Optional[asyncio.Event] = None  # set by stop(); created on the running loop
         self.current_session: Optional[ConversationContext] = None
         self.processing_query = False
         self.main_event_loop: Optional[asyncio.AbstractEventLoop] = None
@@ -196,6 +223,7 @@ class VoiceAssistantOrchestrator:
                 logger.warning(f"Greeting generation failed: {error_result['fallback_response']}")
                 # Continue without greeting
             
+            self._stop_event = asyncio.Event()
             self.is_running = True
             logger.info("🎉 Voice Assistant is ready! Start speaking...")
             
@@ -221,17 +249,7 @@ class VoiceAssistantOrchestrator:
                 return
             
             # Filter out likely audio feedback (assistant's own voice)
-            transcript_lower = voice_input.transcript.lower()
-            feedback_phrases = [
-                "what else would you like",
-                "yes i'm listening",
-                "sure what did you want",
-                "of course go ahead",
-                "what else can i help",
-                "you have another question"
-            ]
-            
-            if any(phrase in transcript_lower for phrase in feedback_phrases):
+            if _FEEDBACK_RE.search(voice_input.transcript.lower()):
                 logger.debug(f"Filtering out likely audio feedback: {voice_input.transcript}")
                 return
             
@@ -329,14 +347,7 @@ class VoiceAssistantOrchestrator:
                         await asyncio.sleep(0.2)
                         
                         # Check if this is a follow-up or addition to previous question
-                        follow_up_indicators = [
-                            'also', 'and', 'additionally', 'plus', 'furthermore',
-                            'what about', 'how about', 'tell me more', 'more details',
-                            'can you also', 'what else', 'anything else'
-                        ]
-                        
-                        transcript_lower = event.transcript.lower()
-                        is_follow_up = any(indicator in transcript_lower for indicator in follow_up_indicators)
+                        is_follow_up = _FOLLOW_UP_RE.search(event.transcript.lower()) is not None
                         
                         if is_follow_up:
                             logger.info(f"🔗 Detected follow-up question: {event.transcript}")
@@ -372,7 +383,7 @@ class VoiceAssistantOrchestrator:
             return
         
         self.processing_query = True
-        start_time = time.time()
+        start_time = time.perf_counter()
         session_id = self.current_session.session_id if self.current_session else None
         
         try:
@@ -412,7 +423,7 @@ class VoiceAssistantOrchestrator:
             response = await self._generate_response(agent_results)
             
             # Add response to conversation history BEFORE speaking (so UI shows it first)
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             self.current_session.add_message(
                 response,
                 "assistant",
@@ -671,6 +682,8 @@ class VoiceAssistantOrchestrator:
             logger.info("🛑 Stopping Voice Assistant...")
             
             self.is_running = False
+            if self._stop_event:
+                self._stop_event.set()
             
             if self.voice_processor:
                 try:
@@ -716,6 +729,16 @@ class VoiceAssistantOrchestrator:
             )
             logger.error(f"Error stopping voice assistant: {error_result['error_id']}")
     
+    async def wait_stopped(self, timeout: Optional[float] = None) -> bool:
+        """Wait until stop() is called; return False if the timeout elapses first."""
+        if not self._stop_event:
+            return not self.is_running
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
     async def get_performance_stats(self) -> Dict[str, Any]:
         """Get current performance statistics."""
         stats = {
@@ -757,13 +780,19 @@ async def main():
     print("Agentic Voice Assistant")
     print("=" * 40)
     
-    # Set up signal handlers for graceful shutdown
-    def signal_handler(signum, frame):
+    # Set up signal handlers for graceful shutdown. They run as loop callbacks
+    # so stop() is scheduled right away rather than when wait_stopped() times out.
+    loop = asyncio.get_running_loop()
+    
+    def signal_handler(signum):
         logger.info(f"Received signal {signum}")
         asyncio.create_task(orchestrator.stop())
     
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, signal_handler, sig)
+        except NotImplementedError:  # e.g. the Windows event loop
+            signal.signal(sig, lambda signum, frame: loop.call_soon_threadsafe(signal_handler, signum))
     
     try:
         # Initialize the orchestrator
@@ -779,30 +808,24 @@ async def main():
         # Keep running until stopped
         logger.info("🎯 Voice Assistant running. Press Ctrl+C to stop.")
         
-        # Performance monitoring loop
-        performance_check_counter = 0
-        
+        # Performance monitoring loop: sleep until stopped, waking every 30 seconds
         while orchestrator.is_running:
-            await asyncio.sleep(1)
-            performance_check_counter += 1
+            if await orchestrator.wait_stopped(timeout=30):
+                break
             
-            # Periodic performance monitoring (every 30 seconds)
-            if performance_check_counter >= 30:
-                performance_check_counter = 0
+            try:
+                stats = await orchestrator.get_performance_stats()
+                avg_time = stats.get('performance_metrics', {}).get('avg_response_time', 0)
+                cache_hit_rate = stats.get('performance_metrics', {}).get('cache_hit_rate', 0)
                 
-                try:
-                    stats = await orchestrator.get_performance_stats()
-                    avg_time = stats.get('performance_metrics', {}).get('avg_response_time', 0)
-                    cache_hit_rate = stats.get('performance_metrics', {}).get('cache_hit_rate', 0)
-                    
-                    if avg_time > orchestrator.response_time_target * 1.5:
-                        logger.warning(f"⚠️ Average response time high: {avg_time:.2f}s")
+                if avg_time > orchestrator.response_time_target * 1.5:
+                    logger.warning(f"⚠️ Average response time high: {avg_time:.2f}s")
+                
+                if avg_time > 0:  # Only log if we have data
+                    logger.info(f"📈 Performance: {avg_time:.2f}s avg, {cache_hit_rate:.1f}% cache hit rate")
                     
-                    if avg_time > 0:  # Only log if we have data
-                        logger.info(f"📈 Performance: {avg_time:.2f}s avg, {cache_hit_rate:.1f}% cache hit rate")
-                        
-                except Exception as e:
-                    logger.error(f"Error in performance monitoring: {e}")
+            except Exception as e:
+                logger.error(f"Error in performance monitoring: {e}")
         
         return 0
         
@@ -817,7 +840,14 @@ async def main():
         return 1
 
 
+def install_event_loop_policy():
+    """Use uvloop for asyncio.run() when it is installed; otherwise keep the default loop."""
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 if __name__ == "__main__":
+    install_event_loop_policy()
     try:
         exit_code = asyncio.run(main())
         sys.exit(exit_code)
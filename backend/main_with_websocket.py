@@ -8,7 +8,7 @@ import asyncio
 import logging
 import signal
 import sys
-from main import VoiceAssistantOrchestrator
+from main import VoiceAssistantOrchestrator, install_event_loop_policy
 from websocket_server import start_websocket_server
 
 # Configure clean logging
@@ -167,6 +167,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_event_loop_policy()
     try:
         exit_code = asyncio.run(main())
         sys.exit(exit_code)
@@ -13,10 +13,11 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
 import hashlib
-import boto3
 from botocore.config import Config
 import threading
 
+from aws_session import get_aws_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -84,11 +85,11 @@ class ResponseTimeMonitor:
     
     async def measure_operation(self, operation_name: str, operation_func, *args, **kwargs):
         """Measure the execution time of an operation."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             result = await operation_func(*args, **kwargs)
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             # Record metrics
             self.metrics.add_response_time(processing_time, operation_name)
@@ -104,7 +105,7 @@ class ResponseTimeMonitor:
             return result, processing_time
             
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             self.metrics.error_count += 1
             
             await self._trigger_alert("operation_error", {
@@ -159,8 +160,9 @@ class AWSConnectionPool:
             with self._client_locks[service_name]:
                 if service_name not in self._clients:
                     logger.info(f"Creating optimized AWS client for {service_name}")
-                    self._clients[service_name] = boto3.client(
+                    self._clients[service_name] = get_aws_client(
                         service_name,
+                        self.region,
                         config=self.config
                     )
         
@@ -276,7 +276,7 @@ Provide just the natural response, no extra formatting."""
         """Make async call to LLM client for response generation."""
         try:
             # Use the converse method for better compatibility
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             response = await loop.run_in_executor(
                 None,
                 lambda: self.llm_client.converse(
@@ -4,20 +4,69 @@ Rule-based intent classification for common queries to avoid slow LLM calls.
 Falls back to LLM only for complex/ambiguous cases.
 """
 
+import functools
 import re
 import logging
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from agents.base_agent import Intent, IntentType
 
 logger = logging.getLogger(__name__)
 
+# Ticket ID extraction, compiled once; "IT 001" forms are tried before the generic ones
+_IT_ID_PATTERNS = (
+    re.compile(r'\bit\s+(\d+)\b', re.IGNORECASE),  # "IT 001"
+    re.compile(r'\bit-(\d+)\b', re.IGNORECASE),     # "IT-001"
+)
+_TICKET_ID_PATTERNS = (
+    re.compile(r'\b(?:ticket|id)\s*(?:id\s*)?(?:#\s*)?([a-zA-Z0-9\-_]+)', re.IGNORECASE),
+    re.compile(r'#(\d+)', re.IGNORECASE),
+    re.compile(r'\b(\d{3,})\b', re.IGNORECASE),
+    re.compile(r'(?:of|for)\s+([a-zA-Z0-9\-_]+)(?:\s|$)', re.IGNORECASE),
+)
+_WORD_ID_PATTERNS = (_TICKET_ID_PATTERNS[0], _TICKET_ID_PATTERNS[3])  # the ones that need no digits
+_NUM_RE = re.compile(r'\d+')
+_DIGIT_RE = re.compile(r'\d')
+# Words the generic ID patterns capture that are never ticket IDs
+_SKIP_WORDS = frozenset({'ticket', 'description', 'resolution', 'status', 'for', 'of', 'my',
+                         'similar', 'current', 'currently', 'open', 'closed'})
+_CLASSIFY_CACHE_SIZE = 512  # distinct normalized queries memoized per classifier
+_NO_ENTITIES = MappingProxyType({})  # shared, read-only entities for intents that carry none
+
+
+def _compile_patterns(patterns: List[Tuple[str, str]]) -> List[Tuple[re.Pattern, str]]:
+    """Compile (regex, tag) pairs case-insensitively, keeping their order."""
+    return [(re.compile(pattern, re.IGNORECASE), pattern_type) for pattern, pattern_type in patterns]
+
+
+def _fuse_patterns(patterns: List[Tuple[re.Pattern, str]],
+                   standalone: Tuple[re.Pattern, ...] = ()) -> Tuple[re.Pattern, List[Tuple[Callable[[str], Any], str]]]:
+    """
+    Pair a category's patterns with one alternation of all of them.
+    
+    The alternation answers "does anything in this category match?" with a
+    single search; only on a hit are the patterns tried in list order to find
+    the tag, so the first pattern in list order still wins. Patterns in
+    ``standalone`` must cover the whole (already stripped) query and are
+    tried with ``fullmatch``.
+    """
+    def is_standalone(pattern: re.Pattern) -> bool:
+        return any(pattern is p for p in standalone)
+    
+    fused = re.compile("|".join(
+        f"\\A(?:{pattern.pattern})\\Z" if is_standalone(pattern) else f"(?:{pattern.pattern})"
+        for pattern, _ in patterns), re.IGNORECASE)
+    matchers = [(pattern.fullmatch if is_standalone(pattern) else pattern.search, pattern_type)
+                for pattern, pattern_type in patterns]
+    return fused, matchers
+
 
 class FastIntentClassifier:
     """Fast rule-based intent classifier with LLM fallback."""
     
     def __init__(self):
         # Ticket-related patterns
-        self.ticket_patterns = [
+        self.ticket_patterns = _compile_patterns([
             # Direct ticket ID references
             (r'\b(?:ticket|id)\s*(?:id\s*)?(?:#\s*)?([a-zA-Z0-9\-_]+)', 'ticket_id'),
             (r'\b(?:it-\d+|#\d+|\d{3,})\b', 'ticket_id'),
@@ -41,10 +90,10 @@ class FastIntentClassifier:
             (r'\b(?:open|closed|pending|resolved)\s+tickets?', 'ticket_search'),
             (r'\b(?:show|list|display|get)\s+(?:me\s+)?(?:all\s+)?(?:my\s+)?(?:high|low|medium|priority|urgent)?\s*(?:priority\s+)?tickets?', 'ticket_search'),
             (r'\b(?:all|high|low|medium)\s+priority\s+tickets?', 'ticket_search'),
-        ]
+        ])
         
         # Knowledge-related patterns
-        self.knowledge_patterns = [
+        self.knowledge_patterns = _compile_patterns([
             # Direct questions
             (r'\b(?:what|how|why|when|where)\s+(?:is|are|do|does|can|should)', 'question'),
             (r'\b(?:how\s+(?:do\s+i|to|can\s+i))', 'how_to'),
@@ -57,10 +106,10 @@ class FastIntentClassifier:
             # Product-specific terms
             (r'\b(?:probe|superops|network|monitor|scan)', 'product_feature'),
             (r'\b(?:install|setup|configure|add|create)', 'setup_help'),
-        ]
+        ])
         
         # Greeting patterns
-        self.greeting_patterns = [
+        self.greeting_patterns = _compile_patterns([
             (r'\b(?:hello|hi|hey|good\s+(?:morning|afternoon|evening))', 'greeting'),
             (r'\b(?:how\s+are\s+you|how\s+do\s+you\s+do)', 'greeting'),
             (r'\b(?:thanks?|thank\s+you)', 'thanks'),
@@ -68,17 +117,24 @@ class FastIntentClassifier:
             (r'\b(?:perfect.*thank|great.*thank)', 'thanks'),
             (r'\b(?:goodbye|see\s+you|have\s+a\s+good)', 'thanks'),
             (r'\b(?:appreciate\s+it)', 'thanks'),
-        ]
+        ])
         
         # Escalation patterns
-        self.escalation_patterns = [
+        self.escalation_patterns = _compile_patterns([
             (r'\b(?:escalate|human|agent|person|representative)', 'escalation'),
             (r'\b(?:speak\s+to|talk\s+to|connect\s+me)', 'escalation'),
             (r'\b(?:transfer|forward|hand\s+over)', 'escalation'),
-        ]
+        ])
         
         # Follow-up patterns
-        self.followup_patterns = [
+        # More details requests (must be standalone, not about specific things);
+        # matched against the whole stripped query rather than anchored with ^...$
+        self._followup_standalone = _compile_patterns([
+            (r'(?:give\s+me\s+)?(?:more\s+)?(?:details|information)', 'more_details'),
+            (r'(?:tell\s+me\s+)?more', 'more_details'),
+            (r'(?:elaborate|expand|continue)', 'more_details'),
+        ])
+        self.followup_patterns = _compile_patterns([
             (r'\b(?:yes|yeah|yep|sure|okay|ok)\b.*(?:show|list|display)', 'followup_show'),
             (r'\b(?:please\s+)?(?:show|list|display)\s+(?:them|those|it)', 'followup_show'),
             (r'\b(?:yes|yeah|yep|sure|okay|ok)\b.*(?:please)', 'followup_confirm'),
@@ -87,18 +143,26 @@ class FastIntentClassifier:
             # New question requests
             (r'\b(?:i\s+have\s+)?(?:another|different|new)\s+question', 'new_question'),
             (r'\b(?:next|different)\s+question', 'new_question'),
-            
-            # More details requests (must be standalone, not about specific things)
-            (r'^\s*(?:give\s+me\s+)?(?:more\s+)?(?:details|information)\s*$', 'more_details'),
-            (r'^\s*(?:tell\s+me\s+)?more\s*$', 'more_details'),
-            (r'^\s*(?:elaborate|expand|continue)\s*$', 'more_details'),
+        ]) + self._followup_standalone + _compile_patterns([
             (r'\b(?:yes|yeah|yep|sure|okay|ok)\b.*(?:more|details|continue)', 'more_details'),
             
             # Contextual reference patterns
             (r'\b(?:who|which\s+team)\s+(?:was\s+)?(?:it\s+)?(?:assigned)', 'contextual_team'),
             (r'\b(?:what\s+(?:was\s+)?(?:the\s+)?(?:resolution\s+time|time))', 'contextual_time'),
             (r'\b(?:that\s+(?:particular\s+)?ticket)', 'contextual_ticket'),
-        ]
+        ])
+    
+        # One fused alternation per category, so a category that misses costs one search
+        self._ticket_re = _fuse_patterns(self.ticket_patterns)
+        self._knowledge_re = _fuse_patterns(self.knowledge_patterns)
+        self._greeting_re = _fuse_patterns(self.greeting_patterns)
+        self._escalation_re = _fuse_patterns(self.escalation_patterns)
+        self._followup_re = _fuse_patterns(
+            self.followup_patterns, standalone=tuple(p for p, _ in self._followup_standalone))
+    
+        # Classification is a pure function of the normalized query, and short
+        # replies ("yes", "more details", "hi") repeat constantly
+        self._classify_cached = functools.lru_cache(maxsize=_CLASSIFY_CACHE_SIZE)(self._classify_impl)
     
     def classify_intent(self, query: str) -> Optional[Intent]:
         """
@@ -110,46 +174,60 @@ class FastIntentClassifier:
         if not query_lower:
             return None
         
+        intent = self._classify_cached(query_lower)
+        if intent is None or intent.entities is _NO_ENTITIES:
+            return intent
+        # Intents are frozen, but hand out a fresh entities dict so callers can't mutate the cached one
+        return Intent(
+            intent_type=intent.intent_type,
+            confidence=intent.confidence,
+            entities=dict(intent.entities),
+            reasoning=intent.reasoning
+        )
+    
+    def _classify_impl(self, query_lower: str) -> Optional[Intent]:
+        """Classify an already lowercased, stripped query (memoized by classify_intent)."""
         # Check for greetings first (highest priority)
-        greeting_match = self._check_patterns(query_lower, self.greeting_patterns)
+        greeting_match = self._check_patterns(query_lower, self._greeting_re)
         if greeting_match:
             return Intent(
                 intent_type=IntentType.GREETING,
                 confidence=0.95,
-                entities={},
+                entities=_NO_ENTITIES,
                 reasoning="Detected greeting pattern"
             )
         
         # Check for escalation requests
-        escalation_match = self._check_patterns(query_lower, self.escalation_patterns)
+        escalation_match = self._check_patterns(query_lower, self._escalation_re)
         if escalation_match:
             return Intent(
                 intent_type=IntentType.ESCALATION,
                 confidence=0.90,
-                entities={},
+                entities=_NO_ENTITIES,
                 reasoning="Detected escalation request"
             )
         
         # Check for ticket-related queries FIRST (before followup patterns)
         ticket_match, ticket_entities = self._check_ticket_patterns(query_lower)
-        knowledge_match = self._check_patterns(query_lower, self.knowledge_patterns)
         
-        # Specific ticket information queries should be ticket_query, not mixed
-        ticket_info_keywords = ['status', 'resolution', 'priority', 'category', 'description', 'assigned', 'created', 'updated']
-        has_ticket_info = any(keyword in query_lower for keyword in ticket_info_keywords)
+        # Every mixed-query indicator needs "also"; without it a ticket match is
+        # returned below, so plain ticket queries never probe the knowledge patterns
+        has_also = 'also' in query_lower
+        knowledge_match = (self._check_patterns(query_lower, self._knowledge_re)
+                           if has_also or not ticket_match else None)
         
         # More precise mixed query detection - only for explicit dual requests
-        explicit_mixed_indicators = [
-            'can you also' in query_lower and any(kw in query_lower for kw in ['what is', 'how to', 'explain']),
-            'and also' in query_lower and ticket_match and knowledge_match,
-            'also tell me' in query_lower and (ticket_match or knowledge_match),
-            'also explain' in query_lower and (ticket_match or knowledge_match),
+        is_mixed = has_also and (
+            ('can you also' in query_lower and any(kw in query_lower for kw in ['what is', 'how to', 'explain']))
+            or ('and also' in query_lower and ticket_match and knowledge_match)
+            or ('also tell me' in query_lower and (ticket_match or knowledge_match))
+            or ('also explain' in query_lower and (ticket_match or knowledge_match))
             # More specific pattern: "I have a ticket... also explain/tell me"
-            'ticket' in query_lower and 'also' in query_lower and any(kw in query_lower for kw in ['explain', 'tell me about', 'what is a', 'how does'])
-        ]
+            or ('ticket' in query_lower and any(kw in query_lower for kw in ['explain', 'tell me about', 'what is a', 'how does']))
+        )
         
         # Only classify as mixed if there are explicit indicators for both types
-        if any(explicit_mixed_indicators):
+        if is_mixed:
             return Intent(
                 intent_type=IntentType.MIXED_QUERY,
                 confidence=0.90,
@@ -165,18 +243,17 @@ class FastIntentClassifier:
                 reasoning=f"Detected ticket query pattern: {ticket_match}"
             )
         
-        # Check for knowledge-related queries
-        knowledge_match = self._check_patterns(query_lower, self.knowledge_patterns)
+        # Check for knowledge-related queries (matched above, before the mixed-query check)
         if knowledge_match:
             return Intent(
                 intent_type=IntentType.KNOWLEDGE_QUERY,
                 confidence=0.85,
-                entities={},
+                entities=_NO_ENTITIES,
                 reasoning=f"Detected knowledge query pattern: {knowledge_match}"
             )
         
         # Check for follow-up queries LAST (only if no specific ticket/knowledge match)
-        followup_match = self._check_patterns(query_lower, self.followup_patterns)
+        followup_match = self._check_patterns(query_lower, self._followup_re)
         if followup_match:
             return Intent(
                 intent_type=IntentType.FOLLOWUP,
@@ -188,26 +265,27 @@ class FastIntentClassifier:
         # If no clear pattern matches, return None for LLM fallback
         return None
     
-    def _check_patterns(self, query: str, patterns: List[Tuple[str, str]]) -> Optional[str]:
-        """Check if query matches any of the given patterns."""
-        for pattern, pattern_type in patterns:
-            if re.search(pattern, query, re.IGNORECASE):
+    def _check_patterns(self, query: str,
+                        fused: Tuple[re.Pattern, List[Tuple[Callable[[str], Any], str]]]) -> Optional[str]:
+        """Return the tag of the first pattern (in list order) that matches the query."""
+        any_pattern, matchers = fused
+        if not any_pattern.search(query):
+            return None
+        for match, pattern_type in matchers:
+            if match(query):
                 return pattern_type
         return None
     
     def _check_ticket_patterns(self, query: str) -> Tuple[Optional[str], Dict[str, str]]:
         """Check for ticket patterns and extract entities."""
         entities = {}
-        matched_pattern = None
         
-        # Extract ticket ID - prioritize "IT 001" patterns
-        it_patterns = [
-            r'\bit\s+(\d+)\b',  # "IT 001"
-            r'\bit-(\d+)\b',    # "IT-001"
-        ]
+        # Patterns that capture digits can't match a query without any
+        has_digit = _DIGIT_RE.search(query) is not None
         
-        for pattern in it_patterns:
-            match = re.search(pattern, query, re.IGNORECASE)
+        # Extract ticket ID - prioritize "IT 001" patterns
+        for pattern in (_IT_ID_PATTERNS if has_digit else ()):
+            match = pattern.search(query)
             if match:
                 number = match.group(1)
                 entities['ticket_id'] = f"IT-{number.zfill(3)}"
@@ -215,28 +293,17 @@ class FastIntentClassifier:
         
         # If no IT pattern found, try other patterns
         if 'ticket_id' not in entities:
-            ticket_id_patterns = [
-                r'\b(?:ticket|id)\s*(?:id\s*)?(?:#\s*)?([a-zA-Z0-9\-_]+)',
-                r'#(\d+)',
-                r'\b(\d{3,})\b',
-                r'(?:of|for)\s+([a-zA-Z0-9\-_]+)(?:\s|$)',
-            ]
-            
-            for pattern in ticket_id_patterns:
-                match = re.search(pattern, query, re.IGNORECASE)
+            for pattern in (_TICKET_ID_PATTERNS if has_digit else _WORD_ID_PATTERNS):
+                match = pattern.search(query)
                 if match:
                     raw_id = match.group(1)
                     # Skip common words and single letters
-                    skip_words = ['ticket', 'description', 'resolution', 'status', 'for', 'of', 'my', 'similar', 'current', 'currently', 'open', 'closed']
-                    if raw_id.lower() not in skip_words and len(raw_id) > 1:
+                    if raw_id.lower() not in _SKIP_WORDS and len(raw_id) > 1:
                         entities['ticket_id'] = self._normalize_ticket_id(raw_id)
                         break
         
         # Check for ticket-related patterns
-        for pattern, pattern_type in self.ticket_patterns:
-            if re.search(pattern, query, re.IGNORECASE):
-                matched_pattern = pattern_type
-                break
+        matched_pattern = self._check_patterns(query, self._ticket_re)
         
         return matched_pattern, entities
     
@@ -248,21 +315,10 @@ class FastIntentClassifier:
         if raw_id.startswith('IT-'):
             return raw_id
         
-        # If it starts with IT but no dash, add the dash
-        if raw_id.startswith('IT') and len(raw_id) > 2:
-            number_part = raw_id[2:]
-            if number_part.isdigit():
-                return f"IT-{number_part.zfill(3)}"
-        
-        # If it's just a number, add IT- prefix and pad with zeros
-        if raw_id.isdigit():
-            return f"IT-{raw_id.zfill(3)}"
-        
-        # If it has other format, try to extract numbers
-        import re
-        numbers = re.findall(r'\d+', raw_id)
-        if numbers:
-            return f"IT-{numbers[0].zfill(3)}"
+        # "IT005", "5" and anything else with digits all take the first run of digits
+        match = _NUM_RE.search(raw_id)
+        if match:
+            return f"IT-{match.group().zfill(3)}"
         
         # Return as is if no clear pattern
         return raw_id
@@ -4,12 +4,134 @@ Converts technical agent responses into natural, human-like conversational respo
 """
 
 import asyncio
+import functools
+import hashlib
+import json
 import logging
-from typing import Dict, Any, List, Optional
+import os
+import random
+import re
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, Any, List, NamedTuple, Optional
 from llm_client import get_llm_client
 
 logger = logging.getLogger(__name__)
 
+# Patterns used by the response cleanup helpers, compiled once at import
+_PERIOD_CAP = re.compile(r'\.([A-Z])')          # missing space after a period
+_WS = re.compile(r'\s+')                        # runs of whitespace
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+')      # sentence boundaries
+_SENT_END = re.compile(r'[.!?]+')               # sentence terminators
+_PREFIX_RE = re.compile(r"^(?:(?:Response|Answer|Here's a natural response|Natural response):\s*)+")  # stacked LLM labels
+
+# Small-talk and escalation detection, one C-level scan per query
+_GREETING_RE = re.compile(r'\b(?:hello|hi|hey|how are you|good (?:morning|afternoon|evening))\b')
+_ESCALATION_RE = re.compile(r'\b(?:escalate|transfer|supervisor|speak to human|talk to person)')
+_THANK_YOU_RE = re.compile(
+    r'\bthank\s+you\b|\bthanks\b|\bthank\s+you\s+(?:so\s+)?much\b|\bappreciate\s+it\b'
+    r'|\bperfect.*thank\b|\bgreat.*thank\b|\bgoodbye\b|\bsee\s+you\b|\bhave\s+a\s+good\b'
+)
+_FOLLOW_UP_RE = re.compile(
+    r'another question|next question|different question|new question'
+    r'|more details|more information|tell me more|continue'
+    r'|yes|no|ok|sure|please'
+)
+
+# Numbered-step formats, tried in order by _extract_steps_from_content
+_STEP_PATTERNS = (
+    re.compile(r'(\d+\.\s+[^.]+\.)', re.IGNORECASE),          # "1. Step description."
+    re.compile(r'(Step\s+\d+[:\s]+[^.]+\.)', re.IGNORECASE),  # "Step 1: Description."
+    re.compile(r'(\d+\)\s+[^.]+\.)', re.IGNORECASE),          # "1) Step description."
+)
+
+# Resolution-time unit abbreviations spelled out for TTS ("2h 30m" -> "2 hours 30 minutes")
+_UNIT_WORDS = str.maketrans({'m': ' minutes', 'h': ' hours', 'd': ' days', 'w': ' weeks'})
+
+# Query phrases that select the knowledge synthesis style, checked in this order
+_STEP_PHRASES = ('how to', 'how do i', 'steps', 'install', 'configure', 'setup', 'create')
+_CONCEPT_PHRASES = ('what is', 'what are', 'explain', 'define', 'meaning')
+_COMPARISON_PHRASES = ('difference', 'compare', 'vs', 'versus', 'features', 'capabilities')
+_TROUBLESHOOTING_PHRASES = ('problem', 'issue', 'error', 'not working', 'fix', 'troubleshoot')
+
+# Shared read-only default for missing payloads in per-turn lookups, so the
+# miss path of result.get('data') doesn't allocate a fresh dict every time
+_EMPTY = MappingProxyType({})
+
+# Agents whose results carry routing decisions rather than answer data
+_SKIP_AGENTS = frozenset({'SupervisorAgent'})
+
+# ResponseData field each data-producing agent's payload goes into (others -> other_results)
+_AGENT_BUCKETS = {'TicketAgent': 'ticket_results', 'KnowledgeAgent': 'knowledge_results'}
+
+# Ticket result types _try_template_response knows how to phrase
+_TICKET_TEMPLATE_TYPES = frozenset({'specific_ticket', 'search_results'})
+
+# Ticket fields a query can ask about, detected once per template lookup
+_FIELD_KEYWORDS = ('status', 'priority', 'category', 'team', 'assigned', 'resolution time', 'resolution')
+
+# Knowledge synthesis instructions keyed by response type
+_SYNTHESIS_INSTRUCTIONS = {
+    "step_by_step": """Provide clear, numbered step-by-step instructions. Be specific and actionable. Include any prerequisites or important notes.""",
+    "concept_explanation": """Provide a clear, concise explanation of the concept. Start with a simple definition, then add relevant details. Make it easy to understand.""",
+    "comparison": """Provide a clear comparison highlighting key differences, similarities, and use cases. Use bullet points if helpful.""",
+    "troubleshooting": """Provide troubleshooting guidance with potential causes and solutions. Be systematic and helpful.""",
+    "general_info": """Provide comprehensive, well-organized information that directly answers the question. Be thorough but concise.""",
+}
+
+_SYNTHESIS_PROMPT_TEMPLATE = """You are an IT support assistant. Based on the documentation provided, answer the user's question comprehensively.
+
+User Question: "{query}"
+
+Available Documentation:
+{content}
+
+Sources: {sources}
+
+Instructions: {instruction}
+
+Requirements:
+- Answer directly and completely based on the documentation
+- Be conversational and human-like, not robotic
+- Use natural language appropriate for voice interaction
+- If the documentation contains step-by-step information, present it clearly
+- Include relevant details but keep it focused
+- Don't mention "based on the documentation" - just provide the answer naturally
+
+Response:"""
+
+# Fixed generation settings for humanization calls; only the prompt varies per request
+_LLM_KWARGS = {"max_tokens": 100, "temperature": 0.2}  # Reduced for speed
+
+# Dedicated pool for blocking LLM client calls so concurrent sessions don't
+# compete with other users of the loop's default executor
+_LLM_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv('LLM_POOL_SIZE', '16')),
+    thread_name_prefix='llm'
+)
+
+# asyncio.timeout() (3.11+) avoids wrapping the awaited coroutine in an extra Task
+_HAS_ASYNCIO_TIMEOUT = sys.version_info >= (3, 11)
+
+
+async def _run_with_timeout(coro, timeout: float):
+    """Await a coroutine, raising asyncio.TimeoutError after ``timeout`` seconds."""
+    if _HAS_ASYNCIO_TIMEOUT:
+        async with asyncio.timeout(timeout):
+            return await coro
+    return await asyncio.wait_for(coro, timeout=timeout)
+
+
+class ResponseData(NamedTuple):
+    """Agent result payloads grouped by the agent that produced them."""
+    ticket_results: List[Dict[str, Any]]
+    knowledge_results: List[Dict[str, Any]]
+    other_results: List[Dict[str, Any]]
+
 
 class ResponseHumanizer:
     """Service to convert technical responses into human-like conversational responses."""
@@ -17,6 +139,12 @@ class ResponseHumanizer:
     def __init__(self):
         self.llm_client = get_llm_client()
         
+        # Humanized LLM answers keyed by prompt hash (LRU), plus the calls still
+        # in flight so identical concurrent prompts share one Bedrock request
+        self._llm_cache: OrderedDict[str, str] = OrderedDict()
+        self._llm_cache_max = 512
+        self._llm_inflight: Dict[str, asyncio.Future] = {}
+        
         # Response templates for different scenarios
         self.greeting_responses = [
             "Hello! I'm doing great, thank you for asking. How can I help you today?",
@@ -30,6 +158,29 @@ class ResponseHumanizer:
             "Hmm, I'm not quite sure about that. Could you provide a bit more detail?",
             "I apologize, but I'm having difficulty with that request. Can you help me understand what you're looking for?"
         ]
+        
+        self.thank_you_responses = [
+            "You're very welcome! Happy to help anytime.",
+            "My pleasure! Feel free to reach out if you need anything else.",
+            "Glad I could help! Have a great day!",
+            "You're welcome! I'm here whenever you need assistance.",
+            "Happy to help! Take care!"
+        ]
+        
+        self.escalation_responses = [
+            "I understand you'd like to speak with someone else. Let me connect you with a human agent who can help you better.",
+            "Of course, let me get you connected with one of our support specialists right away.",
+            "No problem, I'll transfer you to a human agent who can assist you further.",
+            "I hear you - let me get you connected with someone who can provide more personalized help."
+        ]
+        
+        self.clarification_responses = [
+            "I'm not sure I understood that correctly. Could you rephrase your question?",
+            "I didn't quite catch that. Could you try asking in a different way?",
+            "I'm having trouble understanding what you're looking for. Could you be more specific?",
+            "Could you clarify what you're asking about? I want to make sure I help you with the right information.",
+            "I'm not sure I followed that. Could you try rephrasing your question?"
+        ]
     
     async def humanize_response(self, 
                                agent_results: List[Dict[str, Any]], 
@@ -47,26 +198,29 @@ class ResponseHumanizer:
             Human-like conversational response
         """
         try:
+            # Lowercased once here and passed to every predicate below
+            query_lower = original_query.lower()
+            
             # Handle escalation requests FIRST
-            if self._is_escalation_request(agent_results, original_query):
+            if self._is_escalation_request(agent_results, original_query, query_lower):
                 return self._get_escalation_response()
             
             # Check if this is a request for more information about previous response
-            if self._is_more_info_request(original_query):
-                print(f"🔍 Detected more info request: {original_query}")
+            if self._is_more_info_request(original_query, query_lower):
+                logger.debug("🔍 Detected more info request: %s", original_query)
                 if context and context.get('last_response_data'):
-                    print(f"📚 Found stored response data, generating detailed response")
+                    logger.debug("📚 Found stored response data, generating detailed response")
                     return await self._handle_more_info_request(original_query, context['last_response_data'])
                 else:
-                    print(f"❌ No stored response data available")
+                    logger.debug("❌ No stored response data available")
                     return "I'd be happy to provide more details. Could you be more specific about what aspect you'd like me to elaborate on?"
             
             # Handle simple greetings
-            if self._is_greeting(original_query):
+            if self._is_greeting(original_query, query_lower):
                 return self._get_greeting_response()
             
             # Handle thank you messages
-            if self._is_thank_you(original_query):
+            if self._is_thank_you(original_query, query_lower):
                 return self._get_thank_you_response()
             
             # Handle errors
@@ -75,98 +229,55 @@ class ResponseHumanizer:
             
             # Handle empty results with clarification
             if not agent_results or all(not result.get('data') for result in agent_results):
-                return self._get_clarification_response(original_query)
+                return self._get_clarification_response(original_query, query_lower)
             
             # Generate human-like response using LLM
-            return await self._generate_human_response(agent_results, original_query, context)
+            return await self._generate_human_response(agent_results, original_query, context, query_lower)
             
         except Exception as e:
             logger.error(f"Error humanizing response: {e}")
             return "Sorry, I'm having trouble with that. Could you try again?"
     
-    def _is_greeting(self, query: str) -> bool:
-        """Check if the query is a greeting."""
-        import re
-        greeting_patterns = [
-            r'\bhello\b',
-            r'\bhi\b',
-            r'\bhey\b',
-            r'\bhow are you\b',
-            r'\bgood morning\b',
-            r'\bgood afternoon\b',
-            r'\bgood evening\b'
-        ]
-        query_lower = query.lower()
-        return any(re.search(pattern, query_lower) for pattern in greeting_patterns)
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _is_greeting(query: str, query_lower: Optional[str] = None) -> bool:
+        """Check if the query is a greeting (memoized per query)."""
+        return bool(_GREETING_RE.search(query_lower or query.lower()))
     
     def _get_greeting_response(self) -> str:
         """Get a friendly greeting response."""
-        import random
         return random.choice(self.greeting_responses)
     
-    def _is_thank_you(self, query: str) -> bool:
+    def _is_thank_you(self, query: str, query_lower: Optional[str] = None) -> bool:
         """Check if the query is a thank you message."""
-        import re
-        thank_you_patterns = [
-            r'\bthank\s+you\b',
-            r'\bthanks\b',
-            r'\bthank\s+you\s+(?:so\s+)?much\b',
-            r'\bappreciate\s+it\b',
-            r'\bperfect.*thank\b',
-            r'\bgreat.*thank\b',
-            r'\bgoodbye\b',
-            r'\bsee\s+you\b',
-            r'\bhave\s+a\s+good\b'
-        ]
-        query_lower = query.lower()
-        return any(re.search(pattern, query_lower) for pattern in thank_you_patterns)
+        return bool(_THANK_YOU_RE.search(query_lower or query.lower()))
     
     def _get_thank_you_response(self) -> str:
         """Get a friendly thank you response."""
-        thank_you_responses = [
-            "You're very welcome! Happy to help anytime.",
-            "My pleasure! Feel free to reach out if you need anything else.",
-            "Glad I could help! Have a great day!",
-            "You're welcome! I'm here whenever you need assistance.",
-            "Happy to help! Take care!"
-        ]
-        import random
-        return random.choice(thank_you_responses)
+        return random.choice(self.thank_you_responses)
     
     def _has_errors(self, agent_results: List[Dict[str, Any]]) -> bool:
         """Check if any agent results contain errors."""
-        return any(result.get('data', {}).get('error') for result in agent_results)
+        return any((result.get('data') or _EMPTY).get('error') for result in agent_results)
     
     def _get_error_response(self) -> str:
         """Get a friendly error response."""
-        import random
         return random.choice(self.error_responses)
     
-    def _is_escalation_request(self, agent_results: List[Dict[str, Any]], query: str) -> bool:
+    def _is_escalation_request(self, agent_results: List[Dict[str, Any]], query: str,
+                               query_lower: Optional[str] = None) -> bool:
         """Check if this is an escalation request."""
         # Check if supervisor detected escalation intent
         for result in agent_results:
             if result.get('agent_name') == 'SupervisorAgent':
-                data = result.get('data', {})
-                intent = data.get('intent')
-                if intent and hasattr(intent, 'intent_type') and intent.intent_type.value == 'escalation':
+                data = result.get('data') or _EMPTY
+                if getattr(getattr(data.get('intent'), 'intent_type', None), 'value', None) == 'escalation':
                     return True
         
-        # Check for explicit escalation requests only
-        explicit_escalation_keywords = ['escalate', 'transfer', 'supervisor', 'speak to human', 'talk to person']
-        query_lower = query.lower()
-        if any(keyword in query_lower for keyword in explicit_escalation_keywords):
-            return True
-        
-        # Don't escalate for follow-up questions or requests for more info
-        follow_up_indicators = [
-            'another question', 'next question', 'different question', 'new question',
-            'more details', 'more information', 'tell me more', 'continue',
-            'yes', 'no', 'ok', 'sure', 'please'
-        ]
-        
-        if any(indicator in query_lower for indicator in follow_up_indicators):
-            return False  # These are follow-ups, not escalation requests
+        query_lower = query_lower or query.lower()
+        keyword_decision = self._escalation_keyword_decision(query_lower)
+        if keyword_decision is not None:
+            return keyword_decision
         
         # Only escalate if ALL non-supervisor agents require escalation AND we have no useful data
         non_supervisor_results = [r for r in agent_results if r.get('agent_name') != 'SupervisorAgent']
@@ -177,18 +288,18 @@ class ResponseHumanizer:
         # Check if all agents require escalation AND we have no useful data
         all_require_escalation = all(r.get('requires_escalation', False) for r in non_supervisor_results)
         has_useful_data = any(
-            r.get('data', {}).get('type') in ['specific_ticket', 'search_results', 'knowledge_search'] and
-            (r.get('data', {}).get('found') or r.get('data', {}).get('relevant_chunks', 0) > 0)
-            for r in non_supervisor_results
+            data.get('type') in ('specific_ticket', 'search_results', 'knowledge_search') and
+            (data.get('found') or data.get('relevant_chunks', 0) > 0)
+            for data in (r.get('data') or _EMPTY for r in non_supervisor_results)
         )
         
         # Check if this might be a clarification opportunity instead of escalation
         if all_require_escalation and not has_useful_data:
             # Check if query might need clarification (unclear terms, typos, etc.)
             unclear_indicators = [
-                len(query.lower().split()) <= 3,  # Very short queries
-                any(word in query.lower() for word in ['po', 'sulus', 'ops']),  # Potential typos/unclear terms
-                query.lower().strip() in ['no', 'yes', 'ok', 'fine']  # Single word responses
+                len(query_lower.split()) <= 3,  # Very short queries
+                any(word in query_lower for word in ['po', 'sulus', 'ops']),  # Potential typos/unclear terms
+                query_lower.strip() in ['no', 'yes', 'ok', 'fine']  # Single word responses
             ]
             
             if any(unclear_indicators):
@@ -197,24 +308,31 @@ class ResponseHumanizer:
         # Only escalate if all agents failed AND we have no useful data AND it's not a clarification case
         return all_require_escalation and not has_useful_data
     
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _escalation_keyword_decision(query_lower: str) -> Optional[bool]:
+        """Decide escalation from the query wording alone, or None if it doesn't say (memoized per query)."""
+        # Check for explicit escalation requests only
+        if _ESCALATION_RE.search(query_lower):
+            return True
+        
+        # Don't escalate for follow-up questions or requests for more info
+        if _FOLLOW_UP_RE.search(query_lower):
+            return False  # These are follow-ups, not escalation requests
+        
+        return None
+    
     def _get_escalation_response(self) -> str:
         """Get an escalation response."""
-        escalation_responses = [
-            "I understand you'd like to speak with someone else. Let me connect you with a human agent who can help you better.",
-            "Of course, let me get you connected with one of our support specialists right away.",
-            "No problem, I'll transfer you to a human agent who can assist you further.",
-            "I hear you - let me get you connected with someone who can provide more personalized help."
-        ]
-        import random
-        return random.choice(escalation_responses)
+        return random.choice(self.escalation_responses)
     
-    def _get_clarification_response(self, query: str) -> str:
+    def _get_clarification_response(self, query: str, query_lower: Optional[str] = None) -> str:
         """Get a clarification response instead of immediate escalation."""
-        query_lower = query.lower().strip()
+        query_lower = (query_lower or query.lower()).strip()
         
         # Handle follow-up question requests
         if 'another question' in query_lower or 'different question' in query_lower or 'new question' in query_lower:
-            print(f"🔄 Detected follow-up question request: {query}")
+            logger.debug("🔄 Detected follow-up question request: %s", query)
             return "Of course! What would you like to know?"
         
         # Handle requests for more information
@@ -232,59 +350,43 @@ class ResponseHumanizer:
             return "Could you provide a bit more detail about what you're looking for?"
         else:
             # General clarification responses
-            clarification_responses = [
-                "I'm not sure I understood that correctly. Could you rephrase your question?",
-                "I didn't quite catch that. Could you try asking in a different way?",
-                "I'm having trouble understanding what you're looking for. Could you be more specific?",
-                "Could you clarify what you're asking about? I want to make sure I help you with the right information.",
-                "I'm not sure I followed that. Could you try rephrasing your question?"
-            ]
-            import random
-            return random.choice(clarification_responses)
+            return random.choice(self.clarification_responses)
     
     async def _generate_human_response(self, 
                                      agent_results: List[Dict[str, Any]], 
                                      original_query: str,
-                                     context: Optional[Dict[str, Any]] = None) -> str:
+                                     context: Optional[Dict[str, Any]] = None,
+                                     query_lower: Optional[str] = None) -> str:
         """Generate a human-like response using LLM."""
         try:
             # Prepare the data for the LLM
             response_data = self._prepare_response_data(agent_results)
             
             # FAST PATH: Try template responses first to avoid LLM calls
-            if response_data.get('ticket_results'):
-                template_response = self._try_template_response(response_data['ticket_results'], original_query)
-                if template_response:
-                    print(f"📝 Template response: {template_response[:50]}...")
-                    return template_response
-            
-            # FAST PATH: For knowledge queries, try template response first
-            if response_data.get('knowledge_results'):
-                template_response = await self._try_knowledge_template_response(response_data['knowledge_results'], original_query)
-                if template_response:
-                    print(f"📚 Knowledge comprehensive response: {template_response[:50]}...")
-                    return template_response
+            template_response = await self._dispatch_template(response_data, original_query, query_lower)
+            if template_response:
+                return template_response
             
             # FAST PATH: For simple cases, use direct responses without LLM
             if len(agent_results) == 1 and agent_results[0].get('agent_name') == 'SupervisorAgent':
-                intent_data = agent_results[0].get('data', {}).get('intent')
-                if intent_data and hasattr(intent_data, 'intent_type'):
-                    if intent_data.intent_type.value == 'followup':
-                        entities = getattr(intent_data, 'entities', {})
-                        followup_type = entities.get('followup_type', '')
-                        if followup_type == 'new_question':
-                            return "Of course! What would you like to know?"
-                        elif followup_type == 'more_details':
-                            return "I'd be happy to provide more details. What specific aspect would you like me to elaborate on?"
-                    elif intent_data.intent_type.value == 'escalation':
-                        return "I understand you'd like to speak with someone else. Let me connect you with a human agent who can help you better."
+                intent_data = (agent_results[0].get('data') or _EMPTY).get('intent')
+                intent_type = getattr(getattr(intent_data, 'intent_type', None), 'value', None)
+                if intent_type == 'followup':
+                    entities = getattr(intent_data, 'entities', {})
+                    followup_type = entities.get('followup_type', '')
+                    if followup_type == 'new_question':
+                        return "Of course! What would you like to know?"
+                    elif followup_type == 'more_details':
+                        return "I'd be happy to provide more details. What specific aspect would you like me to elaborate on?"
+                elif intent_type == 'escalation':
+                    return "I understand you'd like to speak with someone else. Let me connect you with a human agent who can help you better."
             
             # Create prompt for humanizing the response
             prompt = self._create_humanization_prompt(original_query, response_data, context)
             
             # Generate response using LLM with timeout
             try:
-                response = await asyncio.wait_for(self._call_llm(prompt), timeout=3.0)  # 3 second timeout
+                response = await _run_with_timeout(self._call_llm(prompt), 3.0)  # 3 second timeout
             except asyncio.TimeoutError:
                 logger.warning("LLM call timed out, using fallback response")
                 return self._create_fallback_response(response_data, original_query)
@@ -296,43 +398,7 @@ class ResponseHumanizer:
             logger.error(f"Error generating human response: {e}")
             return "I found some information, but I'm having trouble presenting it clearly. Let me know if you'd like me to try again."
     
-    async def _call_llm(self, prompt: str) -> str:
-        """Call the LLM client to generate a response."""
-        try:
-            # Use the existing LLM client with faster settings
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.llm_client.converse(
-                    messages=[{"role": "user", "content": prompt}],
-                    max_tokens=50,  # Even shorter for speed
-                    temperature=0.1  # Lower temperature for faster, more deterministic responses
-                )
-            )
-            return response
-        except Exception as e:
-            logger.error(f"LLM call failed: {e}")
-            raise
-    
-    def _clean_response(self, response: str) -> str:
-        """Clean up the LLM response."""
-        if not response:
-            return ""
-        
-        # Remove any leading/trailing whitespace
-        cleaned = response.strip()
-        
-        # Remove any markdown formatting that might have been added
-        import re
-        cleaned = re.sub(r'\*\*(.*?)\*\*', r'\1', cleaned)  # Remove bold
-        cleaned = re.sub(r'\*(.*?)\*', r'\1', cleaned)      # Remove italic
-        
-        # Ensure proper sentence ending
-        if cleaned and not cleaned.endswith(('.', '!', '?')):
-            cleaned += '.'
-        
-        return cleaned
-    
-    def _is_more_info_request(self, query: str) -> bool:
+    def _is_more_info_request(self, query: str, query_lower: Optional[str] = None) -> bool:
         """Check if the user is asking for more information about a previous response."""
         more_info_indicators = [
             'more details', 'more information', 'tell me more', 'explain more',
@@ -341,7 +407,7 @@ class ResponseHumanizer:
             'yes please', 'yes', 'continue with', 'go on', 'keep going',
             'give me more', 'show me more', 'additional info'
         ]
-        query_lower = query.lower().strip()
+        query_lower = (query_lower or query.lower()).strip()
         return any(indicator in query_lower for indicator in more_info_indicators)
     
     async def _handle_more_info_request(self, query: str, last_response_data: Dict[str, Any]) -> str:
@@ -404,23 +470,42 @@ Detailed response:"""
             answer = contextual_response.get('answer', '')
             return answer if answer else "I don't have additional details available right now."
     
+    async def _dispatch_template(self, response_data: ResponseData, query: str,
+                                 query_lower: Optional[str] = None) -> Optional[str]:
+        """Answer from the ticket or knowledge templates, trying only buckets that have data."""
+        if response_data.ticket_results:
+            template_response = self._try_template_response(response_data.ticket_results, query, query_lower)
+            if template_response:
+                logger.debug("📝 Template response: %.50s...", template_response)
+                return template_response
+        
+        # For knowledge queries (or mixed ones the ticket templates passed on)
+        if response_data.knowledge_results:
+            template_response = await self._try_knowledge_template_response(response_data.knowledge_results, query)
+            if template_response:
+                logger.debug("📚 Knowledge comprehensive response: %.50s...", template_response)
+                return template_response
+        
+        return None
+    
     async def _try_knowledge_template_response(self, knowledge_results: List[Dict[str, Any]], query: str) -> Optional[str]:
         """Generate concise knowledge response with follow-up offers."""
         try:
-            for knowledge_data in knowledge_results:
-                if knowledge_data.get('type') == 'knowledge_search':
-                    relevant_chunks = knowledge_data.get('relevant_chunks', 0)
-                    confidence = knowledge_data.get('contextual_response', {}).get('confidence', 0.0)
-                    
-                    # If we have relevant chunks, generate concise response
-                    if relevant_chunks > 0 and confidence > 0.3:
-                        return await self._generate_concise_knowledge_response(knowledge_data, query)
-                    elif relevant_chunks == 0:
-                        return "I couldn't find specific information about that in our knowledge base. Could you try rephrasing your question?"
-                    else:
-                        return "I found some information, but I'm not confident it fully answers your question. Could you be more specific?"
+            knowledge_data = next((data for data in knowledge_results
+                                   if data.get('type') == 'knowledge_search'), None)
+            if knowledge_data is None:
+                return None
             
-            return None
+            relevant_chunks = knowledge_data.get('relevant_chunks', 0)
+            confidence = (knowledge_data.get('contextual_response') or _EMPTY).get('confidence', 0.0)
+            
+            # If we have relevant chunks, generate concise response
+            if relevant_chunks > 0 and confidence > 0.3:
+                return await self._generate_concise_knowledge_response(knowledge_data, query)
+            elif relevant_chunks == 0:
+                return "I couldn't find specific information about that in our knowledge base. Could you try rephrasing your question?"
+            else:
+                return "I found some information, but I'm not confident it fully answers your question. Could you be more specific?"
         except Exception as e:
             logger.error(f"Error in knowledge template response: {e}")
             return None
@@ -428,9 +513,7 @@ Detailed response:"""
     async def _generate_concise_knowledge_response(self, knowledge_data: Dict[str, Any], query: str) -> str:
         """Generate a concise knowledge response with follow-up offers."""
         try:
-            # Check if this is a follow-up request for more information
-            if self._is_more_info_request(query):
-                return await self._generate_detailed_knowledge_response(knowledge_data, query)
+            # More-info follow-ups are dispatched by humanize_response before we get here
             
             # Get the contextual response
             contextual_response = knowledge_data.get('contextual_response', {})
@@ -466,26 +549,11 @@ Detailed response:"""
                 steps = self._extract_steps_from_content(answer)
                 if len(steps) > 3:
                     # Show first 3 steps and offer to continue
-                    step_response = "Here are the first 3 steps:\n\n"
-                    for i, step in enumerate(steps[:3], 1):
-                        clean_step = step.strip()
-                        if not clean_step.startswith(str(i)):
-                            step_response += f"{i}. {clean_step}\n"
-                        else:
-                            step_response += f"{clean_step}\n"
-                    
-                    step_response += f"\nThere are {len(steps) - 3} more steps. Would you like me to continue with the remaining steps?"
-                    return step_response
+                    return (f"Here are the first 3 steps:\n\n{self._format_steps(steps[:3])}\n\n"
+                            f"There are {len(steps) - 3} more steps. Would you like me to continue with the remaining steps?")
                 elif steps:
                     # Show all steps if 3 or fewer
-                    step_response = "Here are the steps:\n\n"
-                    for i, step in enumerate(steps, 1):
-                        clean_step = step.strip()
-                        if not clean_step.startswith(str(i)):
-                            step_response += f"{i}. {clean_step}\n"
-                        else:
-                            step_response += f"{clean_step}\n"
-                    return step_response.strip()
+                    return f"Here are the steps:\n\n{self._format_steps(steps)}".strip()
             
             # Fallback to simple response without LLM
             return self._create_fallback_concise_response(knowledge_data, query)
@@ -495,14 +563,14 @@ Detailed response:"""
             # Fallback to simple response
             return self._create_fallback_concise_response(knowledge_data, query)
     
-    def _create_fallback_response(self, response_data: Dict[str, Any], query: str) -> str:
+    def _create_fallback_response(self, response_data: ResponseData, query: str) -> str:
         """Create a fast fallback response when LLM times out."""
         # Check for ticket results
-        if response_data.get('ticket_results'):
+        if response_data.ticket_results:
             return "I found some ticket information. Could you be more specific about what you need?"
         
         # Check for knowledge results
-        if response_data.get('knowledge_results'):
+        if response_data.knowledge_results:
             return "I found some information about that. Would you like me to provide more details?"
         
         # Generic fallback
@@ -518,8 +586,7 @@ Detailed response:"""
                 return "I found some information about that. Would you like me to provide more details?"
             
             # Extract first sentence or key information
-            import re
-            sentences = re.split(r'[.!?]+', answer)
+            sentences = _SENT_END.split(answer, maxsplit=1)
             first_sentence = sentences[0].strip() if sentences else answer
             
             # Clean up "Based on" prefixes
@@ -551,20 +618,20 @@ Detailed response:"""
         query_lower = query.lower()
         return any(indicator in query_lower for indicator in step_indicators)
     
+    def _format_steps(self, steps: List[str]) -> str:
+        """Number steps one per line, keeping any numbering a step already has."""
+        lines = []
+        for i, step in enumerate(steps, 1):
+            clean_step = step.strip()
+            lines.append(clean_step if clean_step.startswith(str(i)) else f"{i}. {clean_step}")
+        return "\n".join(lines)
+    
     def _extract_steps_from_content(self, content: str) -> List[str]:
         """Extract steps from content if it contains step-by-step information."""
-        import re
-        
         # Look for numbered steps
-        step_patterns = [
-            r'(\d+\.\s+[^.]+\.)',  # "1. Step description."
-            r'(Step\s+\d+[:\s]+[^.]+\.)',  # "Step 1: Description."
-            r'(\d+\)\s+[^.]+\.)',  # "1) Step description."
-        ]
-        
         steps = []
-        for pattern in step_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
+        for pattern in _STEP_PATTERNS:
+            matches = pattern.findall(content)
             if matches:
                 steps.extend(matches)
                 break  # Use first pattern that matches
@@ -582,49 +649,50 @@ Detailed response:"""
     def _clean_knowledge_answer(self, answer: str) -> str:
         """Clean up knowledge base answers for better presentation."""
         # Remove redundant "Based on" prefixes if they're too verbose
-        if answer.startswith("Based on ") and ":" in answer:
-            parts = answer.split(":", 1)
-            if len(parts) > 1:
-                content_part = parts[1].strip()
+        head, sep, tail = answer.partition(":") if answer.startswith("Based on ") else (answer, "", "")
+        if sep:
+            content_part = tail.strip()
+            
+            # If the content is substantial, use it directly with better formatting
+            if len(content_part) > 50:
+                # Clean up the content
+                cleaned = content_part
                 
-                # If the content is substantial, use it directly with better formatting
-                if len(content_part) > 50:
-                    # Clean up the content
-                    cleaned = content_part
-                    
-                    # Add proper spacing after periods if missing
-                    import re
-                    cleaned = re.sub(r'\.([A-Z])', r'. \1', cleaned)
-                    
-                    # Break up long sentences for better readability
-                    # Look for natural break points
-                    if len(cleaned) > 150:
-                        # Try to break at logical points
-                        sentences = re.split(r'(?<=[.!?])\s+', cleaned)
-                        if len(sentences) > 1:
-                            # Take first 2-3 sentences for conciseness
-                            cleaned = '. '.join(sentences[:2])
-                            if not cleaned.endswith('.'):
-                                cleaned += '.'
-                    
-                    # Ensure it ends with proper punctuation
-                    if not cleaned.endswith(('.', '!', '?')):
-                        cleaned += '.'
-                    
-                    return cleaned
-                else:
-                    # Keep source reference for short content
-                    source_part = parts[0].replace("Based on ", "According to ")
-                    return f"{source_part}: {content_part}"
+                # Add proper spacing after periods if missing
+                if '.' in cleaned:
+                    cleaned = _PERIOD_CAP.sub(r'. \1', cleaned)
+                
+                # Break up long sentences for better readability
+                # Look for natural break points
+                if len(cleaned) > 150:
+                    # Try to break at logical points
+                    sentences = _SENT_SPLIT.split(cleaned, maxsplit=2)
+                    if len(sentences) > 1:
+                        # Take first 2-3 sentences for conciseness
+                        cleaned = '. '.join(sentences[:2])
+                        if not cleaned.endswith('.'):
+                            cleaned += '.'
+                
+                # Ensure it ends with proper punctuation
+                if not cleaned.endswith(('.', '!', '?')):
+                    cleaned += '.'
+                
+                return cleaned
+            else:
+                # Keep source reference for short content
+                source_part = "According to " + head[len("Based on "):]
+                return f"{source_part}: {content_part}"
         
         # General cleanup for any answer
-        import re
-        answer = re.sub(r'\.([A-Z])', r'. \1', answer)  # Add space after periods
-        answer = re.sub(r'\s+', ' ', answer)  # Normalize whitespace
+        # Well-formed answers are common, so skip the regex engine unless needed
+        if '.' in answer:
+            answer = _PERIOD_CAP.sub(r'. \1', answer)  # Add space after periods
+        if '  ' in answer or not answer.isprintable():
+            answer = _WS.sub(' ', answer)  # Normalize whitespace
         
         # Break up very long responses
         if len(answer) > 200:
-            sentences = re.split(r'(?<=[.!?])\s+', answer)
+            sentences = _SENT_SPLIT.split(answer, maxsplit=2)
             if len(sentences) > 1:
                 answer = '. '.join(sentences[:2])
         
@@ -643,21 +711,20 @@ Detailed response:"""
             if not knowledge_chunks:
                 return contextual_response.get('answer', 'I found some information but cannot present it clearly.')
             
-            # Prepare comprehensive data for Bedrock
+            # Prepare comprehensive data for Bedrock; sources are de-duplicated
+            # in first-seen order (dict keys) so citations stay stable
             all_content = []
-            sources = set()
+            sources = {}
             
             for chunk in knowledge_chunks:
-                chunk_text = chunk.get('text', '')
+                chunk_text = chunk.get('text')
+                if not chunk_text:
+                    continue
+                
+                all_content.append(chunk_text)
                 source = chunk.get('source', 'unknown')
                 page_num = chunk.get('page_number')
-                
-                if chunk_text:
-                    all_content.append(chunk_text)
-                    if page_num:
-                        sources.add(f"{source} (page {page_num})")
-                    else:
-                        sources.add(source)
+                sources[f"{source} (page {page_num})" if page_num else source] = None
             
             # Combine all content
             combined_content = "\n\n".join(all_content)
@@ -679,24 +746,26 @@ Detailed response:"""
             # Fallback to basic contextual response
             return knowledge_data.get('contextual_response', {}).get('answer', 'I found some information but had trouble processing it.')
     
-    def _determine_response_type(self, query: str) -> str:
-        """Determine what type of response is needed based on the query."""
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _determine_response_type(query: str) -> str:
+        """Determine what type of response is needed based on the query (memoized per query)."""
         query_lower = query.lower()
         
         # Step-by-step instructions
-        if any(phrase in query_lower for phrase in ['how to', 'how do i', 'steps', 'install', 'configure', 'setup', 'create']):
+        if any(phrase in query_lower for phrase in _STEP_PHRASES):
             return "step_by_step"
         
         # Concept explanation
-        elif any(phrase in query_lower for phrase in ['what is', 'what are', 'explain', 'define', 'meaning']):
+        elif any(phrase in query_lower for phrase in _CONCEPT_PHRASES):
             return "concept_explanation"
         
         # Comparison or features
-        elif any(phrase in query_lower for phrase in ['difference', 'compare', 'vs', 'versus', 'features', 'capabilities']):
+        elif any(phrase in query_lower for phrase in _COMPARISON_PHRASES):
             return "comparison"
         
         # Troubleshooting
-        elif any(phrase in query_lower for phrase in ['problem', 'issue', 'error', 'not working', 'fix', 'troubleshoot']):
+        elif any(phrase in query_lower for phrase in _TROUBLESHOOTING_PHRASES):
             return "troubleshooting"
         
         # General information
@@ -705,47 +774,22 @@ Detailed response:"""
     
     def _create_knowledge_synthesis_prompt(self, query: str, content: str, sources: List[str], response_type: str) -> str:
         """Create a comprehensive prompt for knowledge synthesis."""
-        
-        # Base instruction based on response type
-        if response_type == "step_by_step":
-            instruction = """Provide clear, numbered step-by-step instructions. Be specific and actionable. Include any prerequisites or important notes."""
-        elif response_type == "concept_explanation":
-            instruction = """Provide a clear, concise explanation of the concept. Start with a simple definition, then add relevant details. Make it easy to understand."""
-        elif response_type == "comparison":
-            instruction = """Provide a clear comparison highlighting key differences, similarities, and use cases. Use bullet points if helpful."""
-        elif response_type == "troubleshooting":
-            instruction = """Provide troubleshooting guidance with potential causes and solutions. Be systematic and helpful."""
-        else:
-            instruction = """Provide comprehensive, well-organized information that directly answers the question. Be thorough but concise."""
-        
-        return f"""You are an IT support assistant. Based on the documentation provided, answer the user's question comprehensively.
-
-User Question: "{query}"
-
-Available Documentation:
-{content}
-
-Sources: {', '.join(sources)}
-
-Instructions: {instruction}
-
-Requirements:
-- Answer directly and completely based on the documentation
-- Be conversational and human-like, not robotic
-- Use natural language appropriate for voice interaction
-- If the documentation contains step-by-step information, present it clearly
-- Include relevant details but keep it focused
-- Don't mention "based on the documentation" - just provide the answer naturally
-
-Response:"""
+        instruction = _SYNTHESIS_INSTRUCTIONS.get(response_type, _SYNTHESIS_INSTRUCTIONS["general_info"])
+        return _SYNTHESIS_PROMPT_TEMPLATE.format(
+            query=query,
+            content=content,
+            sources=', '.join(sources),
+            instruction=instruction
+        )
     
     async def _call_llm_for_knowledge(self, prompt: str) -> str:
         """Call LLM specifically for knowledge synthesis."""
         try:
             # Use faster settings for knowledge synthesis
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.llm_client.converse(
+            response = await asyncio.get_running_loop().run_in_executor(
+                _LLM_POOL,
+                functools.partial(
+                    self.llm_client.converse,
                     messages=[{"role": "user", "content": prompt}],
                     max_tokens=200,  # Reduced for speed
                     temperature=0.3   # Lower temperature for speed
@@ -758,157 +802,143 @@ Response:"""
             logger.error(f"Error calling LLM for knowledge synthesis: {e}")
             raise
     
-    def _try_template_response(self, ticket_results: List[Dict[str, Any]], query: str) -> Optional[str]:
+    def _try_template_response(self, ticket_results: List[Dict[str, Any]], query: str,
+                               query_lower: Optional[str] = None) -> Optional[str]:
         """Try to generate a simple template response for ticket queries."""
+        query_lower = query_lower or query.lower()
+        asked = {field for field in _FIELD_KEYWORDS if field in query_lower}
         try:
-            for ticket_data in ticket_results:
-                if ticket_data.get('type') == 'specific_ticket' and ticket_data.get('found'):
-                    ticket = ticket_data['ticket']
-                    ticket_id = ticket.get('id', 'Unknown')
-                    status = ticket.get('status', 'Unknown')
-                    title = ticket.get('title', '')
-                    
-                    # Multi-part template responses - check for multiple questions
-                    response_parts = []
-                    
-                    # Check for status
-                    if 'status' in query.lower():
-                        if status.lower() == 'resolved':
-                            response_parts.append(f"Ticket {ticket_id} has been resolved")
-                        elif status.lower() == 'open':
-                            response_parts.append(f"Ticket {ticket_id} is currently open and being worked on")
-                        elif status.lower() == 'pending':
-                            response_parts.append(f"Ticket {ticket_id} is pending")
-                        else:
-                            response_parts.append(f"Ticket {ticket_id} status is {status}")
-                    
-                    # Check for resolution time
-                    if 'resolution time' in query.lower():
-                        resolution_time = ticket.get('resolution_time', 'Not specified')
-                        if resolution_time and resolution_time != 'Not specified':
-                            formatted_time = self._format_resolution_time(resolution_time)
-                            response_parts.append(f"it was resolved in {formatted_time}")
-                        else:
-                            response_parts.append("resolution time is not specified")
-                    
-                    # Check for category
-                    if 'category' in query.lower():
-                        category = ticket.get('category', 'Not specified')
-                        response_parts.append(f"it's categorized under {category}")
+            # Only the first ticket result the templates know how to phrase matters
+            ticket_data = next((data for data in ticket_results
+                                if data.get('type') in _TICKET_TEMPLATE_TYPES), None)
+            if ticket_data is None:
+                return None
+            
+            if ticket_data.get('type') == 'specific_ticket' and ticket_data.get('found'):
+                # Read every field once; the branches below only use these locals
+                get = ticket_data['ticket'].get
+                ticket_id = get('id', 'Unknown')
+                status = get('status', 'Unknown')
+                title = get('title', '')
+                priority = get('priority')
+                category = get('category')
+                assigned_team = get('assigned_team')
+                resolution = get('resolution')
+                resolution_time = get('resolution_time')
+                
+                # Multi-part template responses - check for multiple questions
+                response_parts = []
+                
+                # Check for status
+                if 'status' in asked:
+                    if status.lower() == 'resolved':
+                        response_parts.append(f"Ticket {ticket_id} has been resolved")
+                    elif status.lower() == 'open':
+                        response_parts.append(f"Ticket {ticket_id} is currently open and being worked on")
+                    elif status.lower() == 'pending':
+                        response_parts.append(f"Ticket {ticket_id} is pending")
+                    else:
+                        response_parts.append(f"Ticket {ticket_id} status is {status}")
+                
+                # Check for resolution time
+                if 'resolution time' in asked:
+                    if resolution_time and resolution_time != 'Not specified':
+                        formatted_time = self._format_resolution_time(resolution_time)
+                        response_parts.append(f"it was resolved in {formatted_time}")
+                    else:
+                        response_parts.append("resolution time is not specified")
+                
+                # Check for category
+                if 'category' in asked:
+                    response_parts.append(f"it's categorized under {category or 'Not specified'}")
+                
+                # Check for team assignment
+                if 'team' in asked or 'assigned' in asked:
+                    response_parts.append(f"it's assigned to the {assigned_team or 'Not specified'} team")
+                
+                # Check for priority
+                if 'priority' in asked:
+                    if priority and priority != 'Not specified':
+                        response_parts.append(f"it has {priority.lower()} priority")
+                    else:
+                        response_parts.append("priority is not specified")
+                
+                # Check for resolution details
+                if 'resolution' in asked and 'resolution time' not in asked:
+                    if resolution:
+                        response_parts.append(f"resolution: {resolution}")
+                    else:
+                        response_parts.append("no resolution details available")
+                
+                # Combine response parts
+                if response_parts:
+                    if len(response_parts) == 1:
+                        return f"{response_parts[0]}. {title}"
+                    else:
+                        # Join multiple parts naturally
+                        combined = ', '.join(response_parts[:-1]) + ', and ' + response_parts[-1]
+                        return f"{combined}. {title}"
+                
+                # Check if asking for full ticket details (no specific field mentioned)
+                if not asked and ('details' in query_lower or 'about' in query_lower or 'information' in query_lower):
+                    # Generate concise full ticket details without markdown
+                    parts = []
+                    parts.append(f"Ticket {ticket_id}")
                     
-                    # Check for team assignment
-                    if 'team' in query.lower() or 'assigned' in query.lower():
-                        assigned_team = ticket.get('assigned_team', 'Not specified')
-                        response_parts.append(f"it's assigned to the {assigned_team} team")
+                    if title:
+                        parts.append(f"regarding {title}")
                     
-                    # Check for priority
-                    if 'priority' in query.lower():
-                        priority = ticket.get('priority', 'Not specified')
-                        if priority and priority != 'Not specified':
-                            response_parts.append(f"it has {priority.lower()} priority")
-                        else:
-                            response_parts.append("priority is not specified")
+                    if status:
+                        parts.append(f"Status is {status}")
                     
-                    # Check for resolution details
-                    if 'resolution' in query.lower() and 'resolution time' not in query.lower():
-                        resolution = ticket.get('resolution', '')
-                        if resolution:
-                            response_parts.append(f"resolution: {resolution}")
-                        else:
-                            response_parts.append("no resolution details available")
+                    if priority:
+                        parts.append(f"Priority is {priority}")
                     
-                    # Combine response parts
-                    if response_parts:
-                        if len(response_parts) == 1:
-                            return f"{response_parts[0]}. {title}"
-                        else:
-                            # Join multiple parts naturally
-                            combined = response_parts[0]
-                            for i, part in enumerate(response_parts[1:], 1):
-                                if i == len(response_parts) - 1:
-                                    combined += f", and {part}"
-                                else:
-                                    combined += f", {part}"
-                            return f"{combined}. {title}"
+                    if category:
+                        parts.append(f"Category is {category}")
                     
-                    # Check if asking for full ticket details (no specific field mentioned)
-                    query_lower = query.lower()
-                    specific_fields = ['status', 'priority', 'category', 'team', 'assigned', 'resolution time', 'resolution']
-                    is_asking_specific_field = any(field in query_lower for field in specific_fields)
+                    if assigned_team:
+                        parts.append(f"Assigned to {assigned_team} team")
                     
-                    if not is_asking_specific_field and ('details' in query_lower or 'about' in query_lower or 'information' in query_lower):
-                        # Generate concise full ticket details without markdown
-                        parts = []
-                        parts.append(f"Ticket {ticket_id}")
-                        
-                        if title:
-                            parts.append(f"regarding {title}")
-                        
-                        if status:
-                            parts.append(f"Status is {status}")
-                        
-                        if ticket.get('priority'):
-                            parts.append(f"Priority is {ticket['priority']}")
-                        
-                        if ticket.get('category'):
-                            parts.append(f"Category is {ticket['category']}")
-                        
-                        if ticket.get('assigned_team'):
-                            parts.append(f"Assigned to {ticket['assigned_team']} team")
-                        
-                        if ticket.get('resolution'):
-                            resolution = ticket['resolution']
-                            # Keep resolution concise
-                            if len(resolution) > 100:
-                                resolution = resolution[:97] + "..."
-                            parts.append(f"Resolution: {resolution}")
-                        
-                        # Join parts naturally
-                        if len(parts) <= 2:
-                            return ". ".join(parts) + "."
-                        else:
-                            result = parts[0]
-                            for i, part in enumerate(parts[1:], 1):
-                                if i == len(parts) - 1:
-                                    result += f". {part}"
-                                else:
-                                    result += f". {part}"
-                            return result + "."
+                    if resolution:
+                        # Keep resolution concise
+                        if len(resolution) > 100:
+                            resolution = resolution[:97] + "..."
+                        parts.append(f"Resolution: {resolution}")
                     
-                    return None  # Let LLM handle other types of queries
+                    # Join parts naturally
+                    return ". ".join(parts) + "."
                 
-                elif ticket_data.get('type') == 'specific_ticket' and not ticket_data.get('found'):
-                    ticket_id = ticket_data.get('ticket_id', 'that ticket')
-                    return f"I couldn't find {ticket_id} in our system. Could you double-check the ticket number?"
-                
-                elif ticket_data.get('type') == 'search_results':
-                    tickets = ticket_data.get('combined_results', [])  # Use combined_results instead of tickets
-                    total = len(tickets)
+                return None  # Let LLM handle other types of queries
+            
+            elif ticket_data.get('type') == 'specific_ticket' and not ticket_data.get('found'):
+                ticket_id = ticket_data.get('ticket_id', 'that ticket')
+                return f"I couldn't find {ticket_id} in our system. Could you double-check the ticket number?"
+            
+            elif ticket_data.get('type') == 'search_results':
+                tickets = ticket_data.get('combined_results', [])  # Use combined_results instead of tickets
+                total = len(tickets)
 
-                    
-                    if total == 0:
-                        criteria = ticket_data.get('criteria', {})
-                        category = criteria.get('category')
-                        if category:
-                            return f"I couldn't find any tickets in the {category} category."
-                        else:
-                            return "I couldn't find any tickets matching your criteria."
-                    
-                    elif total <= 5:
-                        # List specific tickets
-                        ticket_list = []
-                        for ticket in tickets:
-                            ticket_list.append(f"{ticket.get('id')}: {ticket.get('title')}")
-                        
-                        return f"Here are the matching tickets: " + ", ".join(ticket_list)
-                    
+                
+                if total == 0:
+                    criteria = ticket_data.get('criteria', {})
+                    category = criteria.get('category')
+                    if category:
+                        return f"I couldn't find any tickets in the {category} category."
                     else:
-                        # Too many to list individually - show first 5
-                        ticket_list = []
-                        for ticket in tickets[:5]:  # Show first 5
-                            ticket_list.append(f"{ticket.get('id')}: {ticket.get('title')}")
-                        
-                        return f"I found {total} tickets. Here are the first 5: " + ", ".join(ticket_list)
+                        return "I couldn't find any tickets matching your criteria."
+                
+                elif total <= 5:
+                    # List specific tickets
+                    return "Here are the matching tickets: " + ", ".join(
+                        f"{ticket.get('id')}: {ticket.get('title')}" for ticket in tickets
+                    )
+                
+                else:
+                    # Too many to list individually - show first 5
+                    return f"I found {total} tickets. Here are the first 5: " + ", ".join(
+                        f"{ticket.get('id')}: {ticket.get('title')}" for ticket in islice(tickets, 5)
+                    )
             
             return None
         
@@ -921,47 +951,32 @@ Response:"""
         if not resolution_time:
             return resolution_time
         
-        # Convert common abbreviations to full words for TTS
-        formatted = resolution_time.lower()
-        formatted = formatted.replace('m', ' minutes')
-        formatted = formatted.replace('h', ' hours')
-        formatted = formatted.replace('d', ' days')
-        formatted = formatted.replace('w', ' weeks')
+        # Convert common abbreviations to full words for TTS in a single pass
+        formatted = resolution_time.lower().translate(_UNIT_WORDS)
         
         # Clean up multiple spaces
-        import re
-        formatted = re.sub(r'\s+', ' ', formatted).strip()
-        
-        return formatted
+        return _WS.sub(' ', formatted).strip()
     
-    def _prepare_response_data(self, agent_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _prepare_response_data(self, agent_results: List[Dict[str, Any]]) -> ResponseData:
         """Prepare agent results data for LLM processing."""
-        prepared_data = {
-            'ticket_results': [],
-            'knowledge_results': [],
-            'other_results': []
-        }
+        # Single pass over the results; payloads are shared, not copied
+        prepared = ResponseData([], [], [])
         
         for result in agent_results:
             agent_name = result.get('agent_name', 'unknown')
-            data = result.get('data', {})
             
             # Skip supervisor results - we only want actual data
-            if agent_name == 'SupervisorAgent':
+            if agent_name in _SKIP_AGENTS:
                 continue
-                
-            if 'TicketAgent' in agent_name:
-                prepared_data['ticket_results'].append(data)
-            elif 'KnowledgeAgent' in agent_name:
-                prepared_data['knowledge_results'].append(data)
-            else:
-                prepared_data['other_results'].append(data)
+            
+            bucket = getattr(prepared, _AGENT_BUCKETS.get(agent_name, 'other_results'))
+            bucket.append(result.get('data', {}))
         
-        return prepared_data
+        return prepared
     
     def _create_humanization_prompt(self, 
                                    original_query: str, 
-                                   response_data: Dict[str, Any],
+                                   response_data: ResponseData,
                                    context: Optional[Dict[str, Any]] = None) -> str:
         """Create a concise prompt for humanizing the response."""
         
@@ -971,38 +986,38 @@ Response:"""
             conversation_context = "Previous conversation context available."
         
         # Build data summary
-        data_summary = ""
+        summary_buf = []
         
         # Add ticket results
-        if response_data.get('ticket_results'):
-            for ticket_data in response_data['ticket_results']:
+        if response_data.ticket_results:
+            for ticket_data in response_data.ticket_results:
                 if ticket_data.get('type') == 'specific_ticket':
                     if ticket_data.get('found'):
                         ticket = ticket_data['ticket']
-                        data_summary += f"Ticket {ticket['id']}: {ticket['title']}, Status: {ticket['status']}, Priority: {ticket['priority']}"
+                        summary_buf.append(f"Ticket {ticket['id']}: {ticket['title']}, Status: {ticket['status']}, Priority: {ticket['priority']}")
                         if ticket.get('resolution'):
-                            data_summary += f", Resolution: {ticket['resolution']}"
+                            summary_buf.append(f", Resolution: {ticket['resolution']}")
                     else:
-                        data_summary += f"Ticket {ticket_data.get('ticket_id', 'unknown')} not found"
+                        summary_buf.append(f"Ticket {ticket_data.get('ticket_id', 'unknown')} not found")
                 elif ticket_data.get('type') == 'search_results':
                     total = ticket_data.get('total_found', 0)
                     combined_results = ticket_data.get('combined_results', [])
                     if combined_results:
-                        ticket_list = []
-                        for ticket in combined_results[:3]:  # Show first 3 in summary
-                            ticket_list.append(f"{ticket.get('id')}: {ticket.get('title')}")
-                        data_summary += f"Found {total} tickets including: " + ", ".join(ticket_list)
+                        ticket_list = ", ".join(f"{ticket.get('id')}: {ticket.get('title')}" for ticket in islice(combined_results, 3))  # Show first 3 in summary
+                        summary_buf.append(f"Found {total} tickets including: {ticket_list}")
                     else:
-                        data_summary += f"Found {total} tickets"
+                        summary_buf.append(f"Found {total} tickets")
         
         # Add knowledge results
-        if response_data.get('knowledge_results'):
-            for knowledge_data in response_data['knowledge_results']:
+        if response_data.knowledge_results:
+            for knowledge_data in response_data.knowledge_results:
                 if knowledge_data.get('contextual_response'):
                     answer = knowledge_data['contextual_response'].get('answer', '')
                     if answer:
                         # Take first 100 chars of answer
-                        data_summary += answer[:100] + "..." if len(answer) > 100 else answer
+                        summary_buf.append(answer[:100] + "..." if len(answer) > 100 else answer)
+        
+        data_summary = ''.join(summary_buf)
         
         # Create concise prompt - system context is handled by LLM client
         prompt = f"""User asked: "{original_query}"
@@ -1015,27 +1030,42 @@ Provide a natural, conversational response as an IT support assistant. Be helpfu
         return prompt
     
     async def _call_llm(self, prompt: str) -> str:
+        """Call the LLM, reusing cached or in-flight answers for identical prompts."""
+        key = hashlib.sha1(prompt.encode()).hexdigest()
+        cached = self._llm_cache.get(key)
+        if cached is not None:
+            self._llm_cache.move_to_end(key)
+            return cached
+        
+        task = self._llm_inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._invoke_llm(prompt))
+            self._llm_inflight[key] = task
+            task.add_done_callback(functools.partial(self._store_llm_result, key))
+        
+        # Shield so one caller's timeout doesn't cancel the call others are awaiting
+        return await asyncio.shield(task)
+    
+    def _store_llm_result(self, key: str, task: asyncio.Future) -> None:
+        """Move a finished LLM call from the in-flight map into the LRU cache."""
+        self._llm_inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._llm_cache[key] = task.result()
+        if len(self._llm_cache) > self._llm_cache_max:
+            self._llm_cache.popitem(last=False)
+    
+    async def _invoke_llm(self, prompt: str) -> str:
         """Call the LLM to generate a human-like response."""
         try:
-            # Use faster settings for speed
-            body = {
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "max_tokens": 100,  # Reduced for speed
-                "temperature": 0.2  # Lower temperature for speed
-            }
+            body = {"messages": [{"role": "user", "content": prompt}], **_LLM_KWARGS}
             
-            # Make the call in a thread pool to avoid blocking
-            import asyncio
-            import json
-            loop = asyncio.get_event_loop()
+            # Make the call in the dedicated LLM thread pool to avoid blocking
+            loop = asyncio.get_running_loop()
             response = await loop.run_in_executor(
-                None,
-                lambda: self.llm_client.invoke_model(
+                _LLM_POOL,
+                functools.partial(
+                    self.llm_client.invoke_model,
                     modelId="anthropic.claude-3-5-sonnet-20241022-v2:0",  # Will fallback to Ollama if needed
                     body=json.dumps(body),
                     contentType='application/json'
@@ -1052,20 +1082,8 @@ Provide a natural, conversational response as an IT support assistant. Be helpfu
     
     def _clean_response(self, response: str) -> str:
         """Clean up the LLM response."""
-        # Remove any unwanted prefixes or suffixes
-        response = response.strip()
-        
-        # Remove common LLM artifacts
-        prefixes_to_remove = [
-            "Response:",
-            "Answer:",
-            "Here's a natural response:",
-            "Natural response:",
-        ]
-        
-        for prefix in prefixes_to_remove:
-            if response.startswith(prefix):
-                response = response[len(prefix):].strip()
+        # Remove common LLM artifacts such as leading "Response:" / "Answer:" labels
+        response = _PREFIX_RE.sub('', response.strip(), count=1)
         
         # Ensure the response doesn't end abruptly
         if response and not response.endswith(('.', '!', '?')):
@@ -1074,8 +1092,22 @@ Provide a natural, conversational response as an IT support assistant. Be helpfu
         return response
 
 
-# Global instance
-response_humanizer = ResponseHumanizer()
+# Global instance, created on first use so importing this module doesn't
+# build the LLM client (and resolve AWS credentials) as a side effect
+_response_humanizer: Optional[ResponseHumanizer] = None
+_response_humanizer_lock = threading.Lock()
+
+
+def get_response_humanizer() -> ResponseHumanizer:
+    """Get global ResponseHumanizer instance."""
+    global _response_humanizer
+    
+    if _response_humanizer is None:
+        with _response_humanizer_lock:
+            if _response_humanizer is None:
+                _response_humanizer = ResponseHumanizer()
+    
+    return _response_humanizer
 
 
 async def humanize_agent_response(agent_results: List[Dict[str, Any]], 
@@ -1092,4 +1124,4 @@ async def humanize_agent_response(agent_results: List[Dict[str, Any]],
     Returns:
         Human-like conversational response
     """
-    return await response_humanizer.humanize_response(agent_results, original_query, context)
\ No newline at end of file
+    return await get_response_humanizer().humanize_response(agent_results, original_query, context)
\ No newline at end of file
@@ -0,0 +1,21 @@
+"""Tests for ResponseHumanizer's LLM output cleanup."""
+
+import pytest
+
+from services.response_humanizer import ResponseHumanizer
+
+
+@pytest.fixture
+def humanizer():
+    # _clean_response needs no LLM client, so skip __init__
+    return ResponseHumanizer.__new__(ResponseHumanizer)
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("Response: Your ticket is open.", "Your ticket is open."),
+    ("Response: Answer: Your ticket is open.", "Your ticket is open."),
+    ("  Here's a natural response:\n Natural response: Try restarting", "Try restarting."),
+    ("No label here!", "No label here!"),
+])
+def test_clean_response_strips_leading_labels(humanizer, raw, expected):
+    assert humanizer._clean_response(raw) == expected
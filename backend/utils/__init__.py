@@ -1,4 +1,5 @@
 # Utility modules
-from .data_access import DataAccess
+from .data_access import DataAccess, get_data_access
+from .query_cache import QueryCache
 
-__all__ = ['DataAccess']
\ No newline at end of file
+__all__ = ['DataAccess', 'get_data_access', 'QueryCache']
\ No newline at end of file
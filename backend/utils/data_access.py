@@ -6,15 +6,22 @@ Provides unified interface for ticket and knowledge base queries.
 import sqlite3
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+from typing import List, Dict, Any, Optional, Tuple
 import chromadb
 from chromadb.config import Settings
 import os
 
+from .query_cache import QueryCache
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Identical searches within the TTL skip the embedding call and the ChromaDB query
+SEARCH_CACHE_SIZE = int(os.getenv('SEARCH_CACHE_SIZE', '1024'))
+SEARCH_CACHE_TTL = float(os.getenv('SEARCH_CACHE_TTL', '300'))
+
 
 class DataAccess:
     """
@@ -28,6 +35,7 @@ class DataAccess:
         self.chroma_client = None
         self.knowledge_collection = None
         self.ticket_collection = None
+        self._search_cache = QueryCache(SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL)
         
         # Initialize ChromaDB connection
         self._init_chromadb()
@@ -109,6 +117,11 @@ class DataAccess:
             logger.warning("Ticket collection not available for semantic search")
             return []
         
+        cache_key = ('tickets', query, top_k)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            return [dict(result) for result in cached]
+        
         try:
             # Import here to avoid circular imports
             from llm_client import get_llm_client
@@ -142,6 +155,7 @@ class DataAccess:
                     
                     formatted_results.append(result)
             
+            self._search_cache.put(cache_key, [dict(result) for result in formatted_results])
             return formatted_results
             
         except Exception as e:
@@ -154,6 +168,11 @@ class DataAccess:
             logger.warning("Knowledge collection not available for semantic search")
             return []
         
+        cache_key = ('knowledge', query, top_k)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            return [dict(result) for result in cached]
+        
         try:
             # Import here to avoid circular imports
             from llm_client import get_llm_client
@@ -183,6 +202,7 @@ class DataAccess:
                     }
                     formatted_results.append(result)
             
+            self._search_cache.put(cache_key, [dict(result) for result in formatted_results])
             return formatted_results
             
         except Exception as e:
@@ -389,4 +409,19 @@ class DataAccess:
         except Exception as e:
             logger.error(f"ChromaDB health check failed: {e}")
         
-        return health
\ No newline at end of file
+        return health
+
+
+# One DataAccess (and so one ChromaDB client) per pair of database paths
+_instances: Dict[Tuple[str, str], DataAccess] = {}
+_instances_lock = threading.Lock()
+
+
+def get_data_access(sqlite_db_path: str = "./data/voice_assistant.db", chroma_db_path: str = "./data/chroma_db") -> DataAccess:
+    """Get the shared DataAccess for these database paths, creating it on first use."""
+    key = (sqlite_db_path, chroma_db_path)
+    with _instances_lock:
+        data_access = _instances.get(key)
+        if data_access is None:
+            data_access = _instances[key] = DataAccess(sqlite_db_path, chroma_db_path)
+        return data_access
@@ -7,7 +7,6 @@ Supports macOS Core Audio through sounddevice with async streaming.
 import asyncio
 import sounddevice as sd
 import numpy as np
-import boto3
 import json
 import threading
 import queue
@@ -17,6 +16,8 @@ from dataclasses import dataclass
 from datetime import datetime
 import logging
 
+from aws_session import get_aws_client
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -125,7 +126,7 @@ class VoiceInputHandler:
     def _initialize_aws_client(self):
         """Initialize AWS Transcribe client"""
         try:
-            self.transcribe_client = boto3.client('transcribe', region_name=self.aws_region)
+            self.transcribe_client = get_aws_client('transcribe', self.aws_region)
             logger.info("AWS Transcribe client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize AWS Transcribe client: {e}")
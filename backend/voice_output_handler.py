@@ -7,7 +7,6 @@ Supports macOS Core Audio through sounddevice with async streaming.
 import asyncio
 import sounddevice as sd
 import numpy as np
-import boto3
 import io
 import threading
 import queue
@@ -19,6 +18,8 @@ import logging
 import tempfile
 import os
 
+from aws_session import get_aws_client
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -77,7 +78,7 @@ class VoiceOutputHandler:
     def _initialize_aws_client(self):
         """Initialize AWS Polly client"""
         try:
-            self.polly_client = boto3.client('polly', region_name=self.aws_region)
+            self.polly_client = get_aws_client('polly', self.aws_region)
             logger.info("AWS Polly client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize AWS Polly client: {e}")